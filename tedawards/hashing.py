@@ -6,7 +6,8 @@ messy/incomplete data without relying on multi-column unique constraints.
 """
 
 import hashlib
-from typing import List, Any, Optional
+import operator
+from typing import Iterable, List, Any, Optional
 
 
 def generate_entity_hash(obj: Any, key_fields: List[str]) -> str:
@@ -25,12 +26,15 @@ def generate_entity_hash(obj: Any, key_fields: List[str]) -> str:
         - Deterministic ordering (sorted field names)
         - Uses '|' as field separator
     """
-    parts = []
-
     # Sort fields for deterministic ordering
-    for field in sorted(key_fields):
-        value = getattr(obj, field, None)
+    return _hash_values(getattr(obj, field, None) for field in sorted(key_fields))
+
 
+def _hash_values(values: Iterable[Any]) -> str:
+    """Hash key field values given in sorted field order (see generate_entity_hash)."""
+    parts = []
+
+    for value in values:
         # Skip None values - missing data doesn't break hashing
         if value is None:
             continue
@@ -47,9 +51,12 @@ def generate_entity_hash(obj: Any, key_fields: List[str]) -> str:
     # Generate hash from concatenated parts
     hash_input = '|'.join(parts)
 
-    # Use SHA256 and truncate to 16 chars (64 bits)
-    # Collision probability: ~1 in 10^19 for reasonable dataset sizes
-    return hashlib.sha256(hash_input.encode('utf-8')).hexdigest()[:16]
+    # Use SHA256 and truncate to 16 chars (64 bits); hex-encoding only the first 8 bytes
+    # gives the same string as truncating the full hexdigest.
+    # Collision probability: ~1 in 10^19 for reasonable dataset sizes.
+    # Stored entity_hash values depend on this exact algorithm: changing it would stop
+    # every existing contracting body and contractor from matching on the next import.
+    return hashlib.sha256(hash_input.encode('utf-8')).digest()[:8].hex()
 
 
 class HashableMixin:
@@ -60,11 +67,24 @@ class HashableMixin:
 
     # Subclasses must override this (use ClassVar in Pydantic models)
     HASH_KEY_FIELDS: List[str] = []  # type: ignore
+    _sorted_hash_key_fields: tuple = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Sort once per class instead of on every compute_hash call, and read all
+        # key fields with a single attrgetter call instead of one getattr each
+        cls._sorted_hash_key_fields = tuple(sorted(cls.HASH_KEY_FIELDS))
+        if cls._sorted_hash_key_fields:
+            cls._hash_key_getter = operator.attrgetter(*cls._sorted_hash_key_fields)
 
     def compute_hash(self) -> str:
         """Generate hash from key fields defined in HASH_KEY_FIELDS."""
-        if not self.HASH_KEY_FIELDS:
+        if not self._sorted_hash_key_fields:
             raise NotImplementedError(
                 f"{self.__class__.__name__} must define HASH_KEY_FIELDS"
             )
-        return generate_entity_hash(self, self.HASH_KEY_FIELDS)
+        values = self._hash_key_getter(self)
+        if len(self._sorted_hash_key_fields) == 1:
+            # attrgetter returns a bare value, not a tuple, for a single field
+            values = (values,)
+        return _hash_values(values)
@@ -2,17 +2,19 @@ import click
 import logging
 import os
 from datetime import datetime
-from .scraper import scrape_year, scrape_year_range, scrape_package
+from dotenv import load_dotenv
 
-logging.basicConfig(
-    level=getattr(logging, os.getenv('LOG_LEVEL', 'INFO')),
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+# The scraper module is imported inside each command: importing it builds the
+# database engine and the parser models, which `--help` does not need.
 
 @click.group()
 def cli():
     """TED Awards scraper for EU procurement contract awards."""
-    pass
+    load_dotenv()
+    logging.basicConfig(
+        level=getattr(logging, os.getenv('LOG_LEVEL', 'INFO')),
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
 
 @cli.command()
 @click.option('--year', type=int, required=True,
@@ -23,13 +25,20 @@ def cli():
               help='Maximum issue number to try (default: 300)')
 @click.option('--force-reimport', is_flag=True,
               help='Reimport all data from already-downloaded archives (starts from issue 1)')
-def scrape(year, start_issue, max_issue, force_reimport):
+@click.option('--durable/--fast', default=True,
+              help='--fast commits without waiting for the PostgreSQL WAL flush; a crash may lose the last packages (default: --durable)')
+@click.option('--workers', type=click.IntRange(1, 3), default=1,
+              help='Packages downloaded ahead in parallel with processing (default: 1, TED allows 3)')
+@click.option('--parse-workers', type=click.IntRange(1), default=1,
+              help='Processes parsing package files in parallel (default: 1)')
+def scrape(year, start_issue, max_issue, force_reimport, durable, workers, parse_workers):
     """Scrape TED awards for a specific year.
 
     By default, skips already-downloaded packages and resumes from the next issue.
     Use --force-reimport to process all downloaded archives again (e.g., to rebuild database).
     """
-    scrape_year(year, start_issue, max_issue, force_reimport=force_reimport)
+    from .scraper import scrape_year
+    scrape_year(year, start_issue, max_issue, force_reimport=force_reimport, durable=durable, workers=workers, parse_workers=parse_workers)
 
 @cli.command()
 @click.option('--start-year', type=int, required=True,
@@ -38,13 +47,32 @@ def scrape(year, start_issue, max_issue, force_reimport):
               help='End year for backfill (default: current year)')
 @click.option('--force-reimport', is_flag=True,
               help='Reimport all data from already-downloaded archives')
-def backfill(start_year, end_year, force_reimport):
+@click.option('--durable/--fast', default=True,
+              help='--fast commits without waiting for the PostgreSQL WAL flush; a crash may lose the last packages (default: --durable)')
+@click.option('--workers', type=click.IntRange(1, 3), default=1,
+              help='Packages downloaded ahead in parallel with processing (default: 1, TED allows 3)')
+@click.option('--parse-workers', type=click.IntRange(1), default=1,
+              help='Processes parsing package files in parallel (default: 1)')
+def backfill(start_year, end_year, force_reimport, durable, workers, parse_workers):
     """Backfill TED awards for a range of years.
 
     By default, skips already-downloaded packages and resumes each year from the next issue.
     Use --force-reimport to process all downloaded archives again (e.g., to rebuild database).
     """
-    scrape_year_range(start_year, end_year, force_reimport=force_reimport)
+    from .scraper import scrape_year_range
+    scrape_year_range(start_year, end_year, force_reimport=force_reimport, durable=durable, workers=workers, parse_workers=parse_workers)
+
+@cli.command()
+@click.option('--package', 'package_number', type=int, required=True,
+              help='TED package number in yyyynnnnn format (e.g., 200800001)')
+@click.option('--durable/--fast', default=True,
+              help='--fast commits without waiting for the PostgreSQL WAL flush; a crash may lose the package (default: --durable)')
+@click.option('--parse-workers', type=click.IntRange(1), default=1,
+              help='Processes parsing package files in parallel (default: 1)')
+def package(package_number, durable, parse_workers):
+    """Scrape TED awards for a single daily package."""
+    from .scraper import scrape_package
+    scrape_package(package_number, durable=durable, parse_workers=parse_workers)
 
 if __name__ == '__main__':
     cli()
\ No newline at end of file
@@ -8,8 +8,8 @@ from decimal import Decimal
 from typing import List, Optional
 
 from sqlalchemy import (
-    Column, Date, DateTime, ForeignKey, Integer,
-    Numeric, String, Text, Table, UniqueConstraint, Index
+    DDL, Column, Date, DateTime, ForeignKey, Integer,
+    Numeric, String, Text, Table, UniqueConstraint, Index, event, text
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
@@ -20,13 +20,18 @@ class Base(DeclarativeBase):
     pass
 
 
+# Association tables and ted_documents are keyed by their natural primary key and have
+# short rows, so on SQLite they are stored WITHOUT ROWID: the primary key B-tree holds
+# the rows itself and a key lookup needs one search instead of index + rowid table.
+
 # Association table for award-contractor many-to-many relationship
 award_contractors = Table(
     'award_contractors',
     Base.metadata,
     Column('award_id', Integer, ForeignKey('awards.id', ondelete='CASCADE'), primary_key=True),
     Column('contractor_id', Integer, ForeignKey('contractors.id'), primary_key=True),
-    Column('created_at', DateTime, default=func.now())
+    Column('created_at', DateTime, default=func.now()),
+    sqlite_with_rowid=False
 )
 
 # Association table for document-contracting_body many-to-many relationship
@@ -35,7 +40,8 @@ document_contracting_bodies = Table(
     Base.metadata,
     Column('ted_doc_id', String, ForeignKey('ted_documents.doc_id', ondelete='CASCADE'), primary_key=True),
     Column('contracting_body_id', Integer, ForeignKey('contracting_bodies.id'), primary_key=True),
-    Column('created_at', DateTime, default=func.now())
+    Column('created_at', DateTime, default=func.now()),
+    sqlite_with_rowid=False
 )
 
 
@@ -60,13 +66,16 @@ class TEDDocument(Base):
         secondary=document_contracting_bodies,
         back_populates="documents"
     )
+    # Collections traversed on export (document -> contracts -> awards -> contractors)
+    # load with one IN query per level instead of one query per parent
     contracts: Mapped[List["Contract"]] = relationship(
-        "Contract", back_populates="document", cascade="all, delete-orphan"
+        "Contract", back_populates="document", cascade="all, delete-orphan", lazy="selectin"
     )
 
     __table_args__ = (
         Index('idx_ted_documents_pub_date', 'publication_date'),
         Index('idx_ted_documents_country', 'source_country'),
+        {'sqlite_with_rowid': False},
     )
 
 
@@ -104,6 +113,9 @@ class ContractingBody(Base):
 
     __table_args__ = (
         Index('idx_contracting_body_country', 'country_code'),
+        # Case-insensitive name lookups compare lower(official_name), which a plain
+        # index on the column cannot serve
+        Index('idx_contracting_body_name_lower', text('lower(official_name)')),
     )
 
 
@@ -129,15 +141,17 @@ class Contract(Base):
     document: Mapped["TEDDocument"] = relationship("TEDDocument", back_populates="contracts")
     contracting_body: Mapped["ContractingBody"] = relationship("ContractingBody", back_populates="contracts")
     awards: Mapped[List["Award"]] = relationship(
-        "Award", back_populates="contract", cascade="all, delete-orphan"
+        "Award", back_populates="contract", cascade="all, delete-orphan", lazy="selectin"
     )
 
     __table_args__ = (
         UniqueConstraint('ted_doc_id', 'title', name='uq_contract_doc_title'),
-        Index('idx_contract_document', 'ted_doc_id'),
+        # Composite indexes answer document -> body joins and CPV + value filters from the
+        # index alone; their leading columns also serve single-column lookups
+        Index('idx_contract_doc_body', 'ted_doc_id', 'contracting_body_id'),
         Index('idx_contract_body', 'contracting_body_id'),
         Index('idx_contracts_value', 'total_value'),
-        Index('idx_contracts_cpv', 'main_cpv_code'),
+        Index('idx_contract_cpv_value', 'main_cpv_code', 'total_value'),
     )
 
 
@@ -167,12 +181,18 @@ class Award(Base):
     contractors: Mapped[List["Contractor"]] = relationship(
         "Contractor",
         secondary=award_contractors,
-        back_populates="awards"
+        back_populates="awards",
+        lazy="selectin"
     )
 
     __table_args__ = (
         UniqueConstraint('contract_id', 'award_title', 'conclusion_date', name='uq_award_contract_title_date'),
-        Index('idx_award_contract', 'contract_id'),
+        # Per-contract date and value range scans; contract_id-only lookups use their prefix
+        Index('idx_award_contract_date', 'contract_id', 'conclusion_date'),
+        Index(
+            'idx_award_contract_value', 'contract_id', 'awarded_value',
+            postgresql_include=['awarded_value_currency']
+        ),
         Index('idx_awards_conclusion_date', 'conclusion_date'),
         Index('idx_awards_value', 'awarded_value'),
     )
@@ -205,6 +225,77 @@ class Contractor(Base):
     )
 
     __table_args__ = (
-        Index('idx_contractors_country', 'country_code'),
-        Index('idx_contractors_sme', 'is_sme'),
+        # Covers country-only filters through its prefix as well as name + country lookups
+        Index('idx_contractors_country_name', 'country_code', 'official_name'),
+        Index('idx_contractors_name_lower', text('lower(official_name)')),
+        # SMEs are the minority of contractors: a partial index holds only their rows,
+        # keyed by country for the usual "SMEs in country X" filter
+        Index(
+            'idx_contractors_sme_country', 'country_code',
+            sqlite_where=text('is_sme = 1'), postgresql_where=text('is_sme = 1')
+        ),
     )
+
+
+# Denormalized award view: awards pre-joined with their contract and contracting body,
+# so analytical queries read one relation instead of repeating the three-way join.
+# SQLite gets a plain view; PostgreSQL a materialized view, refreshed after each load
+# by the scraper (REFRESH ... CONCURRENTLY needs the unique index on id).
+AWARD_DENORM_SELECT = """
+    SELECT a.id, a.contract_id, a.contract_number, a.award_title, a.conclusion_date,
+           a.tenders_received, a.awarded_value, a.awarded_value_currency,
+           c.ted_doc_id, c.contracting_body_id, c.main_cpv_code, c.total_value,
+           c.total_value_currency, cb.country_code, cb.nuts_code
+    FROM awards a
+    JOIN contracts c ON a.contract_id = c.id
+    JOIN contracting_bodies cb ON c.contracting_body_id = cb.id
+"""
+
+event.listen(
+    Base.metadata, 'after_create',
+    DDL(f"CREATE VIEW IF NOT EXISTS v_award_denorm AS {AWARD_DENORM_SELECT}").execute_if(dialect='sqlite')
+)
+event.listen(
+    Base.metadata, 'after_create',
+    DDL(f"CREATE MATERIALIZED VIEW IF NOT EXISTS v_award_denorm AS {AWARD_DENORM_SELECT} WITH DATA")
+    .execute_if(dialect='postgresql')
+)
+event.listen(
+    Base.metadata, 'after_create',
+    DDL("CREATE UNIQUE INDEX IF NOT EXISTS idx_award_denorm_id ON v_award_denorm (id)")
+    .execute_if(dialect='postgresql')
+)
+event.listen(
+    Base.metadata, 'before_drop',
+    DDL("DROP VIEW IF EXISTS v_award_denorm").execute_if(dialect='sqlite')
+)
+event.listen(
+    Base.metadata, 'before_drop',
+    DDL("DROP MATERIALIZED VIEW IF EXISTS v_award_denorm").execute_if(dialect='postgresql')
+)
+
+
+class ViewBase(DeclarativeBase):
+    """Base class for read-only models mapped onto views (not created by create_all)."""
+    pass
+
+
+class AwardDenorm(ViewBase):
+    """Read-only awards joined with contract and contracting body (v_award_denorm)."""
+    __tablename__ = 'v_award_denorm'
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    contract_id: Mapped[int] = mapped_column(Integer)
+    contract_number: Mapped[Optional[str]] = mapped_column(String)
+    award_title: Mapped[Optional[str]] = mapped_column(Text)
+    conclusion_date: Mapped[Optional[date]] = mapped_column(Date)
+    tenders_received: Mapped[Optional[int]] = mapped_column(Integer)
+    awarded_value: Mapped[Optional[Decimal]] = mapped_column(Numeric(15, 2))
+    awarded_value_currency: Mapped[Optional[str]] = mapped_column(String)
+    ted_doc_id: Mapped[str] = mapped_column(String)
+    contracting_body_id: Mapped[int] = mapped_column(Integer)
+    main_cpv_code: Mapped[Optional[str]] = mapped_column(String)
+    total_value: Mapped[Optional[Decimal]] = mapped_column(Numeric(15, 2))
+    total_value_currency: Mapped[Optional[str]] = mapped_column(String)
+    country_code: Mapped[Optional[str]] = mapped_column(String)
+    nuts_code: Mapped[Optional[str]] = mapped_column(String)
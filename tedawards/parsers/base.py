@@ -1,17 +1,63 @@
 from abc import ABC, abstractmethod
+from datetime import date
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import ClassVar, Optional, Tuple
+
+from lxml import etree
 
 from ..schema import TedParserResultModel
 
+# Parser for full notice trees, shared by all parsers so it is set up once per process
+# rather than per file. IDs are never looked up and comments never read, so libxml2
+# skips building the ID table and the comment nodes. Files are only parsed on the
+# thread that drives parsing (lxml parsers must not be used concurrently).
+XML_PARSER_OPTIONS = dict(collect_ids=False, remove_comments=True, resolve_entities=False)
+XML_PARSER = etree.XMLParser(**XML_PARSER_OPTIONS)
+
+
+@lru_cache(maxsize=4096)
+def parse_yyyymmdd(value: str) -> date:
+    """Parse a compact YYYYMMDD date as used by the legacy TED formats.
+
+    Slices the digits directly instead of interpreting a strptime format. Results are
+    cached, as the notices of a daily package share a handful of dates.
+
+    Raises:
+        ValueError: If the value is not eight digits forming a valid date
+    """
+    if len(value) != 8 or not value.isdigit():
+        raise ValueError(f"Not a YYYYMMDD date: {value!r}")
+    return date(int(value[:4]), int(value[4:6]), int(value[6:]))
+
+
 class BaseParser(ABC):
     """Base class for TED XML parsers."""
 
+    # Local names of the root elements of files this parser reads. ParserFactory sends
+    # files with these roots straight to this parser; empty for non-XML formats.
+    ROOT_ELEMENTS: ClassVar[Tuple[str, ...]] = ()
+
     @abstractmethod
     def can_parse(self, xml_file: Path) -> bool:
         """Check if this parser can handle the given XML file."""
         pass
 
+    def accept(self, xml_file: Path) -> Tuple[bool, Optional[etree._Element]]:
+        """Check the file like can_parse, also returning its root if the check built the tree.
+
+        Parsers whose check reads the whole notice override this together with
+        parse_root; the others return no root.
+        """
+        return self.can_parse(xml_file), None
+
+    def parse_root(self, root: etree._Element, xml_file: Path) -> Optional[TedParserResultModel]:
+        """Extract data from the root returned by accept, without reading the file again.
+
+        Parsers that return a root from accept must override this.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not parse a root from accept()")
+
     @abstractmethod
     def parse_xml_file(self, xml_file: Path) -> Optional[TedParserResultModel]:
         """Parse XML file and return structured data using Pydantic schema."""
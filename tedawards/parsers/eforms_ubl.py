@@ -1,10 +1,11 @@
 import logging
+import re
 from datetime import date
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from lxml import etree
 
-from .base import BaseParser
+from .base import BaseParser, XML_PARSER_OPTIONS
 from ..schema import (
     TedParserResultModel, TedAwardDataModel, DocumentModel,
     ContractingBodyModel, ContractModel, AwardModel, ContractorModel
@@ -12,17 +13,149 @@ from ..schema import (
 
 logger = logging.getLogger(__name__)
 
+# Namespaces used in eForms
+NAMESPACES = {
+    'can': 'urn:oasis:names:specification:ubl:schema:xsd:ContractAwardNotice-2',
+    'cac': 'urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2',
+    'cbc': 'urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2',
+    'efac': 'http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1',
+    'efbc': 'http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1',
+    'efext': 'http://data.europa.eu/p27/eforms-ubl-extensions/1',
+    'ext': 'urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2'
+}
+
+
+# eForms values are only read from leaf elements, so the indentation between elements
+# is dropped while parsing. Not used for TED 2.0, where itertext() joins paragraphs
+# across that whitespace.
+EFORMS_XML_PARSER = etree.XMLParser(remove_blank_text=True, **XML_PARSER_OPTIONS)
+
+
+def _xpath(expression: str) -> etree.XPath:
+    """Compile an XPath expression against the eForms namespaces.
+
+    element.xpath() parses and compiles its expression on every call; the compiled
+    objects below are built once at import and reused for every file.
+    """
+    return etree.XPath(expression, namespaces=NAMESPACES)
+
+
+# Year suffix of an eForms file name, joined to the notice number with a dash
+YEAR_SUFFIX = re.compile(r'_(\d{4})$')
+
+# Organizations
+COMPANY = _xpath('efac:Company')
+PARTY_ID = _xpath('cac:PartyIdentification/cbc:ID')
+
+
+def _clark(prefix: str, name: str) -> str:
+    """Return the '{namespace}name' tag for a prefixed eForms name."""
+    return f'{{{NAMESPACES[prefix]}}}{name}'
+
+
+# Company fields as a tree of child tags, read in one walk of the efac:Company element.
+# A tag maps to a field name or, for a container, to the table for its children; only
+# the containers listed are entered (cbc:Name is also the contact person's name).
+COMPANY_FIELDS = {
+    _clark('cac', 'PartyName'): {_clark('cbc', 'Name'): 'official_name'},
+    _clark('cac', 'PostalAddress'): {
+        _clark('cbc', 'StreetName'): 'address',
+        _clark('cbc', 'CityName'): 'town',
+        _clark('cbc', 'PostalZone'): 'postal_code',
+        _clark('cac', 'Country'): {_clark('cbc', 'IdentificationCode'): 'country_code'},
+    },
+    _clark('cac', 'Contact'): {
+        _clark('cbc', 'Telephone'): 'phone',
+        _clark('cbc', 'ElectronicMail'): 'email',
+    },
+    _clark('cbc', 'WebsiteURI'): 'url',
+}
+
+
+def _read_fields(elem, table: Dict, fields: Dict[str, Optional[str]]) -> Dict[str, Optional[str]]:
+    """Collect the text of the first element of each field in the table, or None if empty."""
+    for child in elem:
+        key = table.get(child.tag)
+        if key is None:
+            continue
+        if isinstance(key, dict):
+            _read_fields(child, key, fields)
+        elif key not in fields:
+            fields[key] = child.text or None
+    return fields
+
+
+def _clark_path(path: str) -> Tuple[str, ...]:
+    """Return the '{namespace}name' tags of a path of prefixed eForms names."""
+    return tuple(_clark(*step.split(':')) for step in path.split('/'))
+
+
+# Notice-level lookups, each a path of prefixed names read like the XPath .//path: the
+# elements at the end of the path, in document order. They are all collected in one
+# walk of the document by _notice_elements, instead of one XPath tree walk each.
+NOTICE_PATHS = {
+    # Publication date candidates, in order of preference (see _extract_document_data)
+    'publication_date': 'efac:Publication/efbc:PublicationDate',
+    'issue_date': 'cbc:IssueDate',
+    'country_code': 'cac:Country/cbc:IdentificationCode',
+    'contracting_party_id': 'cac:ContractingParty/cac:Party/cac:PartyIdentification/cbc:ID',
+    'organizations': 'efac:Organizations/efac:Organization',
+    'settled_contract_title': 'efac:SettledContract/cbc:Title',
+    'settled_contract_reference': 'efac:SettledContract/efac:ContractReference/cbc:ID',
+    'settled_contract_issue_date': 'efac:SettledContract/cbc:IssueDate',
+    'total_amount': 'efac:NoticeResult/cbc:TotalAmount',
+    'main_cpv_code': 'cac:ProcurementProject/cac:MainCommodityClassification/cbc:ItemClassificationCode',
+    'procurement_type_code': 'cac:ProcurementProject/cbc:ProcurementTypeCode',
+    'procedure_code': 'cac:TenderingProcess/cbc:ProcedureCode',
+    'performance_nuts_code': 'cac:ProcurementProject/cac:RealizedLocation/cac:Address/cbc:CountrySubentityCode',
+    'lot_results': 'efac:LotResult',
+    'payable_amount': 'efac:LotTender/cac:LegalMonetaryTotal/cbc:PayableAmount',
+    'tenderer_ids': 'efac:TenderingParty/efac:Tenderer/cbc:ID',
+}
+
+
+def _index_by_leaf(paths: Dict[str, str]) -> Dict[str, List[Tuple[str, Tuple[str, ...]]]]:
+    """Map the tag each path ends at to (lookup name, ancestor tags from the parent up)."""
+    leaves = {}
+    for name, path in paths.items():
+        *ancestors, leaf = _clark_path(path)
+        leaves.setdefault(leaf, []).append((name, tuple(reversed(ancestors))))
+    return leaves
+
+
+NOTICE_LEAVES = _index_by_leaf(NOTICE_PATHS)
+
+
+def _notice_elements(root) -> Dict[str, List[etree._Element]]:
+    """Collect the elements of every NOTICE_PATHS lookup in one walk of the document."""
+    found = {name: [] for name in NOTICE_PATHS}
+    for elem in root.iter(*NOTICE_LEAVES):
+        for name, ancestors in NOTICE_LEAVES[elem.tag]:
+            ancestor = elem
+            for tag in ancestors:
+                ancestor = ancestor.getparent()
+                if ancestor is None or ancestor.tag != tag:
+                    break
+            else:
+                found[name].append(elem)
+    return found
+
+
 class EFormsUBLParser(BaseParser):
     """Parse eForms UBL ContractAwardNotice XML files and extract award notice data."""
 
+    # All eForms notice types, so non-award notices are only checked by this parser
+    ROOT_ELEMENTS = ('ContractAwardNotice', 'ContractNotice', 'PriorInformationNotice')
+
     def can_parse(self, xml_file: Path) -> bool:
         """Check if this is an eForms UBL ContractAwardNotice format file."""
         try:
-            with open(xml_file, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read(1000)  # Read first 1KB
-            return ('ContractAwardNotice' in content and
-                    'urn:oasis:names:specification:ubl:schema:xsd:ContractAwardNotice-2' in content)
-        except Exception as e:
+            # Checked as bytes, so the header is never decoded
+            with open(xml_file, 'rb') as f:
+                content = f.read(1024)  # Read first 1KB
+            return (b'ContractAwardNotice' in content and
+                    b'urn:oasis:names:specification:ubl:schema:xsd:ContractAwardNotice-2' in content)
+        except OSError as e:
             logger.debug(f"Error reading file {xml_file.name} for eForms UBL detection: {e}")
             return False
 
@@ -33,37 +166,32 @@ class EFormsUBLParser(BaseParser):
     def parse_xml_file(self, xml_path: Path) -> Optional[TedParserResultModel]:
         """Parse an eForms UBL XML file and return structured data."""
         try:
-            tree = etree.parse(xml_path)
+            tree = etree.parse(xml_path, EFORMS_XML_PARSER)
             root = tree.getroot()
 
-            # Define namespaces used in eForms
-            namespaces = {
-                'can': 'urn:oasis:names:specification:ubl:schema:xsd:ContractAwardNotice-2',
-                'cac': 'urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2',
-                'cbc': 'urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2',
-                'efac': 'http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1',
-                'efbc': 'http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1',
-                'efext': 'http://data.europa.eu/p27/eforms-ubl-extensions/1',
-                'ext': 'urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2'
-            }
+            # Notice-level elements are collected in one walk and shared by all extractors
+            notice = _notice_elements(root)
 
             # Extract basic document information
-            doc_data = self._extract_document_data(root, namespaces, xml_path)
+            doc_data = self._extract_document_data(notice, xml_path)
             if not doc_data:
                 return None
 
+            # Organizations are read once and shared by the contracting body and contractors
+            organizations = self._extract_organizations(notice)
+
             # Extract contracting body
-            contracting_body = self._extract_contracting_body(root, namespaces)
+            contracting_body = self._extract_contracting_body(notice, organizations)
             if not contracting_body:
                 return None
 
             # Extract contract information
-            contract = self._extract_contract(root, namespaces)
+            contract = self._extract_contract(notice)
             if not contract:
                 return None
 
             # Extract awards
-            awards = self._extract_awards(root, namespaces)
+            awards = self._extract_awards(notice, organizations)
             if not awards:
                 return None
 
@@ -86,28 +214,17 @@ class EFormsUBLParser(BaseParser):
             logger.error(f"Error parsing eForms UBL file {xml_path}: {e}")
             return None
 
-    def _extract_document_data(self, root, ns, xml_file: Path) -> Optional[Dict]:
+    def _extract_document_data(self, notice, xml_file: Path) -> Optional[Dict]:
         """Extract document metadata from eForms UBL."""
         try:
-            # Extract document ID from filename (more reliable than internal IDs)
-            doc_id = xml_file.stem
-            # Handle both _2024 and _2025 patterns
-            if '_2024' in doc_id:
-                doc_id = doc_id.replace('_2024', '-2024')
-            elif '_2025' in doc_id:
-                doc_id = doc_id.replace('_2025', '-2025')
-            else:
-                # Generic pattern for future years
-                import re
-                doc_id = re.sub(r'_(\d{4})$', r'-\1', doc_id)
+            # Extract document ID from filename (more reliable than internal IDs),
+            # e.g. 00012345_2025 -> 00012345-2025
+            doc_id = YEAR_SUFFIX.sub(r'-\1', xml_file.stem)
 
             # Extract publication date from various possible locations
-            pub_date_elem = (
-                root.xpath('.//efac:Publication/efbc:PublicationDate', namespaces=ns) or
-                root.xpath('.//cbc:IssueDate', namespaces=ns) or
-                root.xpath('.//efac:SettledContract/cbc:IssueDate', namespaces=ns) or
-                root.xpath('.//cac:ContractAwardNotice/cbc:IssueDate', namespaces=ns)
-            )
+            # (efbc:PublicationDate, else the first cbc:IssueDate; any SettledContract
+            # IssueDate is also a cbc:IssueDate)
+            pub_date_elem = notice['publication_date'] or notice['issue_date']
 
             # Parse ISO format date (YYYY-MM-DD), strip timezone if present
             if not pub_date_elem or not pub_date_elem[0].text:
@@ -126,7 +243,7 @@ class EFormsUBLParser(BaseParser):
                 raise
 
             # Extract sender country
-            countries = root.xpath('.//cac:Country/cbc:IdentificationCode/text()', namespaces=ns)
+            countries = [elem.text for elem in notice['country_code'] if elem.text]
             country = countries[0] if countries else ''
 
             # Create official journal reference
@@ -150,58 +267,59 @@ class EFormsUBLParser(BaseParser):
             logger.error(f"Error extracting document data: {e}")
             return None
 
-    def _extract_contracting_body(self, root, ns) -> Optional[Dict]:
+    def _extract_organizations(self, notice) -> List[Tuple[Optional[str], Optional[etree._Element]]]:
+        """Return (organization ID, efac:Company element) for each organization, in document order.
+
+        The ID is None when the organization has no company or the company has no ID.
+        """
+        organizations = []
+        for org in notice['organizations']:
+            companies = COMPANY(org)
+            company = companies[0] if companies else None
+            org_id = None
+            if company is not None:
+                org_id_elem = PARTY_ID(company)
+                org_id = org_id_elem[0].text if org_id_elem and org_id_elem[0].text else None
+            organizations.append((org_id, company))
+        return organizations
+
+    def _extract_contracting_body(self, notice, organizations) -> Optional[Dict]:
         """Extract contracting body information from eForms UBL."""
         try:
             # Find the contracting party organization ID from the main document structure
-            contracting_party_id_elem = root.xpath('.//cac:ContractingParty/cac:Party/cac:PartyIdentification/cbc:ID', namespaces=ns)
+            contracting_party_id_elem = notice['contracting_party_id']
             contracting_party_id = contracting_party_id_elem[0].text if contracting_party_id_elem and contracting_party_id_elem[0].text else None
 
             if not contracting_party_id:
                 # Fallback to first organization if no contracting party specified
-                orgs = root.xpath('.//efac:Organizations/efac:Organization', namespaces=ns)
-                if orgs:
-                    contracting_body = orgs[0].find('.//efac:Company', ns)
+                if organizations:
+                    contracting_body = organizations[0][1]
                 else:
                     return None
             else:
                 # Find the organization with the matching ID
-                contracting_body = None
-                orgs = root.xpath('.//efac:Organizations/efac:Organization', namespaces=ns)
-                for org in orgs:
-                    company = org.find('.//efac:Company', ns)
-                    if company is not None:
-                        org_id_elem = company.xpath('.//cac:PartyIdentification/cbc:ID', namespaces=ns)
-                        org_id = org_id_elem[0].text if org_id_elem and org_id_elem[0].text else None
-                        if org_id == contracting_party_id:
-                            contracting_body = company
-                            break
+                contracting_body = next(
+                    (company for org_id, company in organizations if org_id == contracting_party_id),
+                    None
+                )
 
             if contracting_body is None:
                 return None
 
-            # Extract all fields with explicit xpath calls
-            name_elem = contracting_body.xpath('.//cac:PartyName/cbc:Name', namespaces=ns)
-            address_elem = contracting_body.xpath('.//cac:PostalAddress/cbc:StreetName', namespaces=ns)
-            town_elem = contracting_body.xpath('.//cac:PostalAddress/cbc:CityName', namespaces=ns)
-            postal_elem = contracting_body.xpath('.//cac:PostalAddress/cbc:PostalZone', namespaces=ns)
-            country_elem = contracting_body.xpath('.//cac:PostalAddress/cac:Country/cbc:IdentificationCode', namespaces=ns)
-            phone_elem = contracting_body.xpath('.//cac:Contact/cbc:Telephone', namespaces=ns)
-            email_elem = contracting_body.xpath('.//cac:Contact/cbc:ElectronicMail', namespaces=ns)
-            url_elem = contracting_body.xpath('.//cbc:WebsiteURI', namespaces=ns)
+            fields = _read_fields(contracting_body, COMPANY_FIELDS, {})
 
             return {
-                'official_name': name_elem[0].text if (name_elem and name_elem[0].text) else '',
-                'address': address_elem[0].text if (address_elem and address_elem[0].text) else None,
-                'town': town_elem[0].text if (town_elem and town_elem[0].text) else None,
-                'postal_code': postal_elem[0].text if (postal_elem and postal_elem[0].text) else None,
-                'country_code': country_elem[0].text if (country_elem and country_elem[0].text) else None,
+                'official_name': fields.get('official_name') or '',
+                'address': fields.get('address'),
+                'town': fields.get('town'),
+                'postal_code': fields.get('postal_code'),
+                'country_code': fields.get('country_code'),
                 'nuts_code': None,  # TODO: Extract NUTS if available
                 'contact_point': '',
-                'phone': phone_elem[0].text if (phone_elem and phone_elem[0].text) else None,
-                'email': email_elem[0].text if (email_elem and email_elem[0].text) else None,
+                'phone': fields.get('phone'),
+                'email': fields.get('email'),
                 'fax': '',
-                'url_general': url_elem[0].text if (url_elem and url_elem[0].text) else None,
+                'url_general': fields.get('url'),
                 'url_buyer': '',
                 'authority_type_code': '',
                 'main_activity_code': ''
@@ -210,19 +328,19 @@ class EFormsUBLParser(BaseParser):
             logger.error(f"Error extracting contracting body: {e}")
             raise
 
-    def _extract_contract(self, root, ns) -> Optional[Dict]:
+    def _extract_contract(self, notice) -> Optional[Dict]:
         """Extract contract information from eForms UBL."""
         try:
             # Get contract title from settled contract
-            title_elem = root.xpath('.//efac:SettledContract/cbc:Title', namespaces=ns)
+            title_elem = notice['settled_contract_title']
             title = title_elem[0].text if (title_elem and title_elem[0].text) else ''
 
             # Get contract reference
-            ref_elem = root.xpath('.//efac:SettledContract/efac:ContractReference/cbc:ID', namespaces=ns)
+            ref_elem = notice['settled_contract_reference']
             ref_number = ref_elem[0].text if (ref_elem and ref_elem[0].text) else None
 
             # Get total value
-            total_amount = root.xpath('.//efac:NoticeResult/cbc:TotalAmount', namespaces=ns)
+            total_amount = notice['total_amount']
             total_value = None
             total_currency = ''
             if total_amount and total_amount[0].text:
@@ -234,19 +352,19 @@ class EFormsUBLParser(BaseParser):
                 total_currency = total_amount[0].get('currencyID', '')
 
             # Extract main CPV code
-            cpv_elem = root.xpath('.//cac:ProcurementProject/cac:MainCommodityClassification/cbc:ItemClassificationCode', namespaces=ns)
+            cpv_elem = notice['main_cpv_code']
             main_cpv = cpv_elem[0].text if (cpv_elem and cpv_elem[0].text) else None
 
             # Extract contract nature
-            nature_elem = root.xpath('.//cac:ProcurementProject/cbc:ProcurementTypeCode', namespaces=ns)
+            nature_elem = notice['procurement_type_code']
             contract_nature_code = nature_elem[0].text if (nature_elem and nature_elem[0].text) else None
 
             # Extract procedure type
-            proc_elem = root.xpath('.//cac:TenderingProcess/cbc:ProcedureCode', namespaces=ns)
+            proc_elem = notice['procedure_code']
             procedure_type_code = proc_elem[0].text if (proc_elem and proc_elem[0].text) else None
 
             # Extract performance NUTS code
-            nuts_elem = root.xpath('.//cac:ProcurementProject/cac:RealizedLocation/cac:Address/cbc:CountrySubentityCode', namespaces=ns)
+            nuts_elem = notice['performance_nuts_code']
             nuts_code = nuts_elem[0].text if (nuts_elem and nuts_elem[0].text) else None
 
             return {
@@ -265,50 +383,54 @@ class EFormsUBLParser(BaseParser):
             logger.error(f"Error extracting contract: {e}")
             raise
 
-    def _extract_awards(self, root, ns) -> List[Dict]:
+    def _extract_awards(self, notice, organizations) -> List[Dict]:
         """Extract award information from eForms UBL."""
         try:
-            awards = []
-
             # Get lot results (awards)
-            lot_results = root.xpath('.//efac:LotResult', namespaces=ns)
+            lot_results = notice['lot_results']
+            if not lot_results:
+                return []
 
-            for lot_result in lot_results:
-                # Get conclusion date
-                conclusion_date_elem = root.xpath('.//efac:SettledContract/cbc:IssueDate', namespaces=ns)
-                conclusion_date_parsed = None
-                if conclusion_date_elem and conclusion_date_elem[0].text:
-                    try:
-                        raw_date = conclusion_date_elem[0].text.strip()
-                        date_only = raw_date.split('Z')[0].split('+')[0].split('T')[0]
-                        conclusion_date_parsed = date.fromisoformat(date_only)
-                    except (ValueError, AttributeError, IndexError) as e:
-                        logger.error(f"Invalid conclusion date format: {conclusion_date_elem[0].text}. Expected ISO date format. Error: {e}")
-                        raise
-
-                # Get tender information
-                tender_amount = root.xpath('.//efac:LotTender/cac:LegalMonetaryTotal/cbc:PayableAmount', namespaces=ns)
-                awarded_value = None
-                awarded_currency = ''
-                if tender_amount and tender_amount[0].text:
-                    try:
-                        awarded_value = float(tender_amount[0].text)
-                    except (ValueError, TypeError) as e:
-                        logger.error(f"Invalid awarded value: {tender_amount[0].text}. Error: {e}")
-                        raise
-                    awarded_currency = tender_amount[0].get('currencyID', '')
-
-                # Extract contractors
-                contractors = self._extract_contractors(root, ns)
-
-                # Get award title
-                award_title_elem = root.xpath('.//efac:SettledContract/cbc:Title', namespaces=ns)
-                award_title = award_title_elem[0].text if (award_title_elem and award_title_elem[0].text) else None
-
-                # Get contract number
-                contract_num_elem = root.xpath('.//efac:SettledContract/efac:ContractReference/cbc:ID', namespaces=ns)
-                contract_number = contract_num_elem[0].text if (contract_num_elem and contract_num_elem[0].text) else None
+            # The values below are read at notice level, so every lot gets the same
+            # ones; they are looked up once rather than once per lot.
 
+            # Get conclusion date
+            conclusion_date_elem = notice['settled_contract_issue_date']
+            conclusion_date_parsed = None
+            if conclusion_date_elem and conclusion_date_elem[0].text:
+                try:
+                    raw_date = conclusion_date_elem[0].text.strip()
+                    date_only = raw_date.split('Z')[0].split('+')[0].split('T')[0]
+                    conclusion_date_parsed = date.fromisoformat(date_only)
+                except (ValueError, AttributeError, IndexError) as e:
+                    logger.error(f"Invalid conclusion date format: {conclusion_date_elem[0].text}. Expected ISO date format. Error: {e}")
+                    raise
+
+            # Get tender information
+            tender_amount = notice['payable_amount']
+            awarded_value = None
+            awarded_currency = ''
+            if tender_amount and tender_amount[0].text:
+                try:
+                    awarded_value = float(tender_amount[0].text)
+                except (ValueError, TypeError) as e:
+                    logger.error(f"Invalid awarded value: {tender_amount[0].text}. Error: {e}")
+                    raise
+                awarded_currency = tender_amount[0].get('currencyID', '')
+
+            # Extract contractors
+            contractors = self._extract_contractors(notice, organizations)
+
+            # Get award title
+            award_title_elem = notice['settled_contract_title']
+            award_title = award_title_elem[0].text if (award_title_elem and award_title_elem[0].text) else None
+
+            # Get contract number
+            contract_num_elem = notice['settled_contract_reference']
+            contract_number = contract_num_elem[0].text if (contract_num_elem and contract_num_elem[0].text) else None
+
+            awards = []
+            for lot_result in lot_results:
                 award = {
                     'award_title': award_title,
                     'conclusion_date': conclusion_date_parsed,
@@ -333,52 +455,34 @@ class EFormsUBLParser(BaseParser):
             logger.error(f"Error extracting awards: {e}")
             return []
 
-    def _extract_contractors(self, root, ns) -> List[Dict]:
+    def _extract_contractors(self, notice, organizations) -> List[Dict]:
         """Extract contractor information from eForms UBL."""
         try:
             contractors = []
 
             # Find winning tenderer organization IDs from tender results
-            winning_org_ids = set()
-            tenderer_parties = root.xpath('.//efac:TenderingParty', namespaces=ns)
-            for party in tenderer_parties:
-                tenderer_ids = party.xpath('.//efac:Tenderer/cbc:ID/text()', namespaces=ns)
-                winning_org_ids.update(tenderer_ids)
+            winning_org_ids = {elem.text for elem in notice['tenderer_ids'] if elem.text}
 
             # Find contractor organizations by matching winning organization IDs
-            orgs = root.xpath('.//efac:Organizations/efac:Organization', namespaces=ns)
-
-            for org in orgs:
-                company = org.find('.//efac:Company', ns)
+            for org_id, company in organizations:
                 if company is not None:
-                    org_id_elem = company.xpath('.//cac:PartyIdentification/cbc:ID', namespaces=ns)
-                    org_id = org_id_elem[0].text if (org_id_elem and org_id_elem[0].text) else None
-
                     # Only include organizations that are winning tenderers
                     if org_id in winning_org_ids:
-                        name_elem = company.xpath('.//cac:PartyName/cbc:Name', namespaces=ns)
-                        official_name = name_elem[0].text if (name_elem and name_elem[0].text) else None
+                        fields = _read_fields(company, COMPANY_FIELDS, {})
+                        official_name = fields.get('official_name')
 
                         if official_name:  # Only add if we have a name
-                            address_elem = company.xpath('.//cac:PostalAddress/cbc:StreetName', namespaces=ns)
-                            town_elem = company.xpath('.//cac:PostalAddress/cbc:CityName', namespaces=ns)
-                            postal_elem = company.xpath('.//cac:PostalAddress/cbc:PostalZone', namespaces=ns)
-                            country_elem = company.xpath('.//cac:PostalAddress/cac:Country/cbc:IdentificationCode', namespaces=ns)
-                            phone_elem = company.xpath('.//cac:Contact/cbc:Telephone', namespaces=ns)
-                            email_elem = company.xpath('.//cac:Contact/cbc:ElectronicMail', namespaces=ns)
-                            url_elem = company.xpath('.//cbc:WebsiteURI', namespaces=ns)
-
                             contractor = {
                                 'official_name': official_name,
-                                'address': address_elem[0].text if (address_elem and address_elem[0].text) else None,
-                                'town': town_elem[0].text if (town_elem and town_elem[0].text) else None,
-                                'postal_code': postal_elem[0].text if (postal_elem and postal_elem[0].text) else None,
-                                'country_code': country_elem[0].text if (country_elem and country_elem[0].text) else None,
+                                'address': fields.get('address'),
+                                'town': fields.get('town'),
+                                'postal_code': fields.get('postal_code'),
+                                'country_code': fields.get('country_code'),
                                 'nuts_code': None,
-                                'phone': phone_elem[0].text if (phone_elem and phone_elem[0].text) else None,
-                                'email': email_elem[0].text if (email_elem and email_elem[0].text) else None,
+                                'phone': fields.get('phone'),
+                                'email': fields.get('email'),
                                 'fax': None,
-                                'url': url_elem[0].text if (url_elem and url_elem[0].text) else None,
+                                'url': fields.get('url'),
                                 'is_sme': False
                             }
                             contractors.append(contractor)
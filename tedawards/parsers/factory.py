@@ -1,11 +1,40 @@
+import re
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+
+from lxml import etree
+
 from .base import BaseParser
 from .ted_v2 import TedV2Parser
 from .eforms_ubl import EFormsUBLParser
 from .ted_meta_xml import TedMetaXmlParser
 from .ted_internal_ojs import TedInternalOjsParser
 
+# Bytes read from the start of a file to find its root element
+HEADER_SIZE = 4096
+
+# Root element start tag, after an optional BOM, XML declaration, comments and DOCTYPE
+ROOT_ELEMENT = re.compile(
+    rb'(?:\xef\xbb\xbf)?(?:\s+|<\?.*?\?>|<!--.*?-->|<!DOCTYPE(?:[^\[>]|\[.*?\])*>)*<(?:[\w.-]+:)?([\w.-]+)',
+    re.DOTALL
+)
+
+
+def _root_element(xml_file: Path) -> Optional[str]:
+    """Return the local name of the file's root element, read from its first bytes.
+
+    Returns None for files that are not XML (such as ZIP archives) or whose root
+    element does not start within HEADER_SIZE bytes.
+    """
+    try:
+        with open(xml_file, 'rb') as f:
+            header = f.read(HEADER_SIZE)
+    except OSError:
+        return None
+    match = ROOT_ELEMENT.match(header)
+    return match.group(1).decode('ascii', 'replace') if match else None
+
+
 class ParserFactory:
     """Factory for creating appropriate parsers for different formats."""
 
@@ -16,14 +45,39 @@ class ParserFactory:
             TedV2Parser(),           # Unified TED 2.0 parser (R2.0.7, R2.0.8, R2.0.9)
             EFormsUBLParser(),       # eForms UBL (2024+)
         ]
+        self.parsers_by_root: Dict[str, BaseParser] = {
+            root: parser for parser in self.parsers for root in parser.ROOT_ELEMENTS
+        }
+
+    def _candidates(self, xml_file: Path) -> List[BaseParser]:
+        """Return the parsers to check the file with, in order.
+
+        A file whose root element belongs to one parser is only checked by that parser,
+        so most notices of a package cost one check instead of one per format. Other
+        files (ZIP archives, unknown roots) are offered to every parser in turn.
+        """
+        parser = self.parsers_by_root.get(_root_element(xml_file))
+        return [parser] if parser is not None else self.parsers
 
     def get_parser(self, xml_file: Path) -> Optional[BaseParser]:
         """Get the appropriate parser for the given XML file."""
-        for parser in self.parsers:
+        for parser in self._candidates(xml_file):
             if parser.can_parse(xml_file):
                 return parser
         return None
 
+    def detect(self, xml_file: Path) -> Tuple[Optional[BaseParser], Optional[etree._Element]]:
+        """Get the parser for the file like get_parser, with the root its check built.
+
+        The root is None unless the parser read the whole notice while checking it,
+        in which case it is passed to parser.parse_root instead of parsing the file again.
+        """
+        for parser in self._candidates(xml_file):
+            accepted, root = parser.accept(xml_file)
+            if accepted:
+                return parser, root
+        return None, None
+
     def get_supported_formats(self) -> List[str]:
         """Get list of supported format names."""
         return [parser.get_format_name() for parser in self.parsers]
\ No newline at end of file
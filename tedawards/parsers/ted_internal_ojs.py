@@ -7,10 +7,9 @@ import logging
 import re
 from pathlib import Path
 from typing import Optional, List
-from datetime import datetime
 from lxml import etree
 
-from .base import BaseParser
+from .base import BaseParser, XML_PARSER, parse_yyyymmdd
 from ..schema import (
     TedParserResultModel, TedAwardDataModel, DocumentModel,
     ContractingBodyModel, ContractModel, AwardModel, ContractorModel
@@ -19,9 +18,72 @@ from ..schema import (
 logger = logging.getLogger(__name__)
 
 
+# Compiled XPath lookups, shared by every file (element.xpath() would parse and
+# compile its expression on each call)
+NAT_NOTICE = etree.XPath('.//BIB_DOC_S/NAT_NOTICE/text()')
+CONTRACT_AWARD_SUM = etree.XPath('.//CONTRACT_AWARD_SUM')
+BIB_INFO = etree.XPath('.//BIB_INFO')
+BIB_DOC_S = etree.XPath('.//BIB_DOC_S')
+REF_OJS = etree.XPath('.//REF_OJS')
+# Direct child, to skip the NO_DOC_OJS of REF_NOTICE
+NO_DOC_OJS = etree.XPath('./NO_DOC_OJS/text()')
+DELETION_DATE = etree.XPath('.//TECHNICAL_INFO/DELETION_DATE/text()')
+CA_PROFILE = etree.XPath('.//FD_CONTRACT_AWARD_SUM//CA_CE_CONCESSIONAIRE_PROFILE')
+TITLE = etree.XPath('.//TI_DOC/P/text()')
+NOTICE_TITLE = etree.XPath('.//BIB_DOC_S//TI_DOC/P/text()')
+ORIGINAL_CPV = etree.XPath('.//ORIGINAL_CPV/text()')
+DESCRIPTION = etree.XPath('.//DESCRIPTION_SUM/P/text()')
+TOTAL_VALUE = etree.XPath('.//TOTAL_FINAL_VALUE//VALUE_COST/text()')
+TOTAL_CURRENCY = etree.XPath('.//TOTAL_FINAL_VALUE//COSTS_RANGE_AND_CURRENCY_WITH_VAT_RATE/@CURRENCY')
+AWARDS = etree.XPath('.//AWARD_OF_CONTRACT_SUM')
+CONTRACT_NUMBER = etree.XPath('.//CONTRACT_NUMBER/text()')
+AWARD_VALUE = etree.XPath('.//CONTRACT_VALUE_INFORMATION//VALUE_COST/text()')
+AWARD_CURRENCY = etree.XPath('.//CONTRACT_VALUE_INFORMATION//COSTS_RANGE_AND_CURRENCY_WITH_VAT_RATE/@CURRENCY')
+CONTACT_DATA = etree.XPath('.//CONTACT_DATA_WITHOUT_RESPONSIBLE_NAME')
+
+
+# Field tables for _extract_fields: (field name, compiled XPath returning strings,
+# converter for the first match, value when nothing matches)
+REF_OJS_FIELDS = (
+    ('no_oj', etree.XPath('.//NO_OJ/text()'), str.strip, ''),
+    ('date_pub', etree.XPath('.//DATE_PUB/text()'), str.strip, ''),
+)
+BIB_DOC_FIELDS = (
+    ('iso_country', etree.XPath('./ISO_COUNTRY/text()'), str.strip, ''),
+    ('date_disp', etree.XPath('./DATE_DISP/text()'), str.strip, ''),
+)
+CONTACT_FIELDS = (
+    ('official_name', etree.XPath('.//ORGANISATION/text()'), str.strip, ''),
+    ('address', etree.XPath('.//ADDRESS/text()'), str.strip, ''),
+    ('town', etree.XPath('.//TOWN/text()'), str.strip, ''),
+    ('postal_code', etree.XPath('.//POSTAL_CODE/text()'), str.strip, ''),
+    ('country_code', etree.XPath('.//COUNTRY/@VALUE'), str, None),
+    ('phone', etree.XPath('.//PHONE/text()'), str.strip, ''),
+    ('email', etree.XPath('.//E_MAIL/text()'), str.strip, ''),
+    ('fax', etree.XPath('.//FAX/text()'), str.strip, ''),
+)
+
+
+def _first_text(element, xpath: etree.XPath) -> str:
+    """Return the first text matched by a compiled XPath, stripped, or '' when none."""
+    values = xpath(element)
+    return values[0].strip() if values else ''
+
+
+def _extract_fields(element, fields) -> dict:
+    """Read every field of a field table from the element in one loop."""
+    data = {}
+    for name, xpath, convert, default in fields:
+        values = xpath(element)
+        data[name] = convert(values[0]) if values else default
+    return data
+
+
 class TedInternalOjsParser(BaseParser):
     """Parser for TED INTERNAL_OJS format (R2.0.5, 2008)."""
 
+    ROOT_ELEMENTS = ('INTERNAL_OJS',)
+
     def can_parse(self, file_path: Path) -> bool:
         """Check if this file uses INTERNAL_OJS format."""
         try:
@@ -29,7 +91,7 @@ class TedInternalOjsParser(BaseParser):
             if not file_path.suffix.lower() == '.en':
                 return False
 
-            tree = etree.parse(file_path)
+            tree = etree.parse(file_path, XML_PARSER)
             root = tree.getroot()
 
             # Check for INTERNAL_OJS root element
@@ -37,12 +99,12 @@ class TedInternalOjsParser(BaseParser):
                 return False
 
             # Check if it's an award notice (NAT_NOTICE = 7)
-            nat_notice = root.xpath('.//BIB_DOC_S/NAT_NOTICE/text()')
+            nat_notice = NAT_NOTICE(root)
             if not nat_notice or nat_notice[0] != '7':
                 return False
 
             # Must have CONTRACT_AWARD_SUM form
-            has_award_form = len(root.xpath('.//CONTRACT_AWARD_SUM')) > 0
+            has_award_form = len(CONTRACT_AWARD_SUM(root)) > 0
 
             return has_award_form
 
@@ -57,7 +119,7 @@ class TedInternalOjsParser(BaseParser):
     def parse_xml_file(self, xml_file: Path) -> Optional[TedParserResultModel]:
         """Parse an INTERNAL_OJS XML file and extract award data."""
         try:
-            tree = etree.parse(xml_file)
+            tree = etree.parse(xml_file, XML_PARSER)
             root = tree.getroot()
 
             logger.debug(f"Processing {xml_file.name} as INTERNAL_OJS R2.0.5")
@@ -107,43 +169,43 @@ class TedInternalOjsParser(BaseParser):
     def _extract_document_info(self, root, xml_file: Path) -> Optional[dict]:
         """Extract document metadata from BIB_INFO section."""
         try:
-            bib_info = root.xpath('.//BIB_INFO')[0]
-            bib_doc_s = root.xpath('.//BIB_DOC_S')[0]
+            bib_info = BIB_INFO(root)[0]
+            bib_doc_s = BIB_DOC_S(root)[0]
 
             # Extract OJS reference info
-            ref_ojs = bib_info.xpath('.//REF_OJS')[0]
-            no_oj = self._get_text(ref_ojs, './/NO_OJ')
-            date_pub = self._get_text(ref_ojs, './/DATE_PUB')
-            lg_oj = self._get_text(ref_ojs, './/LG_OJ')
+            ref_ojs = REF_OJS(bib_info)[0]
+            ref_ojs_fields = _extract_fields(ref_ojs, REF_OJS_FIELDS)
+            no_oj = ref_ojs_fields['no_oj']
+            date_pub = ref_ojs_fields['date_pub']
 
-            # Extract document reference (use direct child to avoid REF_NOTICE)
-            no_doc_ojs_elems = bib_doc_s.xpath('./NO_DOC_OJS/text()')
+            # Extract document reference
+            no_doc_ojs_elems = NO_DOC_OJS(bib_doc_s)
             no_doc_ojs = no_doc_ojs_elems[0] if no_doc_ojs_elems else ''
-            iso_country = self._get_text(bib_doc_s, './ISO_COUNTRY')
-            date_disp = self._get_text(bib_doc_s, './DATE_DISP')
-            date_rec = self._get_text(bib_doc_s, './DATE_REC')
+            bib_doc_fields = _extract_fields(bib_doc_s, BIB_DOC_FIELDS)
+            iso_country = bib_doc_fields['iso_country']
+            date_disp = bib_doc_fields['date_disp']
 
             # Parse dates
             publication_date = None
             if date_pub and len(date_pub) == 8:
                 try:
-                    publication_date = datetime.strptime(date_pub, '%Y%m%d').date()
+                    publication_date = parse_yyyymmdd(date_pub)
                 except ValueError:
                     logger.warning(f"Invalid publication date format: {date_pub}")
 
             dispatch_date = None
             if date_disp and len(date_disp) == 8:
                 try:
-                    dispatch_date = datetime.strptime(date_disp, '%Y%m%d').date()
+                    dispatch_date = parse_yyyymmdd(date_disp)
                 except ValueError:
                     logger.warning(f"Invalid dispatch date format: {date_disp}")
 
             # Extract deletion date from TECHNICAL_INFO
             deletion_date = None
-            deletion_date_str = self._get_text(root, './/TECHNICAL_INFO/DELETION_DATE')
+            deletion_date_str = _first_text(root, DELETION_DATE)
             if deletion_date_str and len(deletion_date_str) == 8:
                 try:
-                    deletion_date = datetime.strptime(deletion_date_str, '%Y%m%d').date()
+                    deletion_date = parse_yyyymmdd(deletion_date_str)
                 except ValueError:
                     pass
 
@@ -170,32 +232,16 @@ class TedInternalOjsParser(BaseParser):
         """Extract contracting body information."""
         try:
             # Find contracting authority in FD_CONTRACT_AWARD_SUM
-            ca_profile = root.xpath('.//FD_CONTRACT_AWARD_SUM//CA_CE_CONCESSIONAIRE_PROFILE')[0]
-
-            organisation = self._get_text(ca_profile, './/ORGANISATION')
-            address = self._get_text(ca_profile, './/ADDRESS')
-            town = self._get_text(ca_profile, './/TOWN')
-            postal_code = self._get_text(ca_profile, './/POSTAL_CODE')
-            country = ca_profile.xpath('.//COUNTRY/@VALUE')
-            country_code = country[0] if country else None
-            phone = self._get_text(ca_profile, './/PHONE')
-            email = self._get_text(ca_profile, './/E_MAIL')
-            fax = self._get_text(ca_profile, './/FAX')
-
-            if not organisation:
+            ca_profile = CA_PROFILE(root)[0]
+
+            contact = _extract_fields(ca_profile, CONTACT_FIELDS)
+            if not contact['official_name']:
                 return None
 
             return {
-                'official_name': organisation,
-                'address': address or '',
-                'town': town or '',
-                'postal_code': postal_code or '',
-                'country_code': country_code,
+                **contact,
                 'nuts_code': None,
                 'contact_point': '',
-                'phone': phone or '',
-                'email': email or '',
-                'fax': fax or '',
                 'url_general': '',
                 'url_buyer': '',
                 'authority_type_code': '',
@@ -209,29 +255,29 @@ class TedInternalOjsParser(BaseParser):
     def _extract_contract_info(self, root) -> Optional[dict]:
         """Extract contract information."""
         try:
-            bib_doc_s = root.xpath('.//BIB_DOC_S')[0]
+            bib_doc_s = BIB_DOC_S(root)[0]
 
             # Extract title from TI_DOC
-            title_parts = bib_doc_s.xpath('.//TI_DOC/P/text()')
+            title_parts = TITLE(bib_doc_s)
             title = title_parts[0] if title_parts else ''
 
-            # Extract reference number (use direct child to avoid REF_NOTICE)
-            no_doc_ojs_elems = bib_doc_s.xpath('./NO_DOC_OJS/text()')
+            # Extract reference number
+            no_doc_ojs_elems = NO_DOC_OJS(bib_doc_s)
             no_doc_ojs = no_doc_ojs_elems[0] if no_doc_ojs_elems else ''
 
             # Extract CPV code
-            cpv_code = self._get_text(bib_doc_s, './/ORIGINAL_CPV')
+            cpv_code = _first_text(bib_doc_s, ORIGINAL_CPV)
 
             # Extract description from form
-            description = self._get_text(root, './/DESCRIPTION_SUM/P')
+            description = _first_text(root, DESCRIPTION)
 
             # Extract total value
             total_value = None
             total_currency = None
-            value_elem = root.xpath('.//TOTAL_FINAL_VALUE//VALUE_COST/text()')
+            value_elem = TOTAL_VALUE(root)
             if value_elem:
                 total_value = self._parse_value(value_elem[0])
-                currency_elem = root.xpath('.//TOTAL_FINAL_VALUE//COSTS_RANGE_AND_CURRENCY_WITH_VAT_RATE/@CURRENCY')
+                currency_elem = TOTAL_CURRENCY(root)
                 total_currency = currency_elem[0] if currency_elem else None
 
             return {
@@ -257,57 +303,41 @@ class TedInternalOjsParser(BaseParser):
 
         try:
             # Find all AWARD_OF_CONTRACT_SUM elements
-            award_elements = root.xpath('.//AWARD_OF_CONTRACT_SUM')
+            award_elements = AWARDS(root)
 
             if not award_elements:
                 return None
 
             for award_elem in award_elements:
                 # Extract contract number
-                contract_number = self._get_text(award_elem, './/CONTRACT_NUMBER')
+                contract_number = _first_text(award_elem, CONTRACT_NUMBER)
 
                 # Extract award value
                 awarded_value = None
                 awarded_currency = None
-                value_elem = award_elem.xpath('.//CONTRACT_VALUE_INFORMATION//VALUE_COST/text()')
+                value_elem = AWARD_VALUE(award_elem)
                 if value_elem:
                     awarded_value = self._parse_value(value_elem[0])
-                    currency_elem = award_elem.xpath('.//CONTRACT_VALUE_INFORMATION//COSTS_RANGE_AND_CURRENCY_WITH_VAT_RATE/@CURRENCY')
+                    currency_elem = AWARD_CURRENCY(award_elem)
                     awarded_currency = currency_elem[0] if currency_elem else None
 
                 # Extract contractors
                 contractors = []
-                contractor_elems = award_elem.xpath('.//ECONOMIC_OPERATOR_NAME_ADDRESS')
-                for contractor_elem in contractor_elems:
-                    contact_data = contractor_elem.xpath('.//CONTACT_DATA_WITHOUT_RESPONSIBLE_NAME')[0] if contractor_elem.xpath('.//CONTACT_DATA_WITHOUT_RESPONSIBLE_NAME') else None
+                for contractor_elem in award_elem.iterdescendants('ECONOMIC_OPERATOR_NAME_ADDRESS'):
+                    contact_data_elems = CONTACT_DATA(contractor_elem)
+                    contact_data = contact_data_elems[0] if contact_data_elems else None
                     if contact_data is not None:
-                        org_name = self._get_text(contact_data, './/ORGANISATION')
-                        if org_name:
-                            address = self._get_text(contact_data, './/ADDRESS')
-                            town = self._get_text(contact_data, './/TOWN')
-                            postal_code = self._get_text(contact_data, './/POSTAL_CODE')
-                            country = contact_data.xpath('.//COUNTRY/@VALUE')
-                            country_code = country[0] if country else None
-                            email = self._get_text(contact_data, './/E_MAIL')
-                            phone = self._get_text(contact_data, './/PHONE')
-                            fax = self._get_text(contact_data, './/FAX')
-
+                        contact = _extract_fields(contact_data, CONTACT_FIELDS)
+                        if contact['official_name']:
                             contractors.append({
-                                'official_name': org_name,
-                                'address': address or '',
-                                'town': town or '',
-                                'postal_code': postal_code or '',
-                                'country_code': country_code,
+                                **contact,
                                 'nuts_code': None,
-                                'phone': phone or '',
-                                'email': email or '',
-                                'fax': fax or '',
                                 'url': '',
                                 'is_sme': False
                             })
 
                 # Get title from contract info (reuse from parent)
-                title_parts = root.xpath('.//BIB_DOC_S//TI_DOC/P/text()')
+                title_parts = NOTICE_TITLE(root)
                 title = title_parts[0] if title_parts else ''
 
                 awards.append({
@@ -333,14 +363,6 @@ class TedInternalOjsParser(BaseParser):
             logger.error(f"Error extracting awards: {e}")
             return None
 
-    def _get_text(self, element, xpath: str) -> str:
-        """Safely extract text from XML element using XPath."""
-        try:
-            result = element.xpath(xpath + '/text()')
-            return result[0].strip() if result and result[0] else ''
-        except Exception:
-            return ''
-
     def _parse_value(self, value_str: str) -> Optional[float]:
         """Parse monetary value from string."""
         try:
@@ -7,11 +7,10 @@ import logging
 import re
 import zipfile
 from pathlib import Path
-from typing import List, Optional
-from datetime import datetime
+from typing import Iterator, List, Optional
 from lxml import etree
 
-from .base import BaseParser
+from .base import BaseParser, parse_yyyymmdd
 from ..schema import (
     TedParserResultModel, TedAwardDataModel, DocumentModel,
     ContractingBodyModel, ContractModel, AwardModel, ContractorModel
@@ -19,6 +18,38 @@ from ..schema import (
 
 logger = logging.getLogger(__name__)
 
+# EUR amounts in notice text: an amount after the currency ('EUR 1 000'), then an
+# amount before it ('1 000 EUR'), EUR before €
+AMOUNT_AFTER_CURRENCY = [
+    re.compile(r'EUR\s*([\d,.\s]+)', re.IGNORECASE),
+    re.compile(r'€\s*([\d,.\s]+)', re.IGNORECASE),
+]
+CURRENCIES = [re.compile('EUR', re.IGNORECASE), re.compile('€')]
+AMOUNT_RUN = re.compile(r'[\d,.\s]*')
+
+
+def _amount_candidates(text: str) -> Iterator[str]:
+    """Yield the first amount after, then before, each currency in pattern order.
+
+    An amount before a currency is the run of digits, separators and whitespace ending
+    at it. A regex for that has no literal prefix, so it is retried at every position
+    of the text and runs to the end of each whitespace run. Instead the currency is
+    searched for, and the run ending at it is matched on the reversed text.
+    """
+    for pattern in AMOUNT_AFTER_CURRENCY:
+        match = pattern.search(text)
+        if match:
+            yield match.group(1)
+
+    reversed_text = text[::-1]
+    for currency in CURRENCIES:
+        for match in currency.finditer(text):
+            end = match.start()
+            run = AMOUNT_RUN.match(reversed_text, len(text) - end)
+            if run.end() > run.start():
+                yield text[end - (run.end() - run.start()):end]
+                break
+
 
 class TedMetaXmlParser(BaseParser):
     """Parser for TED META XML format contained in ZIP archives."""
@@ -95,7 +126,13 @@ class TedMetaXmlParser(BaseParser):
             return None
 
     def _parse_meta_xml_zip(self, zip_path: Path) -> Optional[TedParserResultModel]:
-        """Parse META XML ZIP file and extract all award notices."""
+        """Parse META XML ZIP file and extract all award notices.
+
+        A daily META file holds every notice of the issue (over a thousand <doc>
+        elements), of which only the award notices are converted. The archive member
+        is streamed through iterparse and each <doc> is cleared once all of its
+        notices have been read, so the whole document tree is never held in memory.
+        """
         try:
             with zipfile.ZipFile(zip_path, 'r') as zf:
                 names = zf.namelist()
@@ -103,31 +140,33 @@ class TedMetaXmlParser(BaseParser):
                     logger.warning(f"No files found in {zip_path}")
                     return None
 
-                # Read and parse XML content
-                xml_content = zf.read(names[0]).decode('utf-8', errors='ignore')
-                root = etree.fromstring(xml_content.encode('utf-8'))
-
                 # Find all award documents
                 award_records = []
 
-                # Process CONTRACT_AWARD elements (all languages - English is marked with lg="en")
-                for doc in root.xpath('.//CONTRACT_AWARD[@category="orig"]'):
-                    # Only process English language documents for META XML format
-                    # (META XML has separate files per language, so we want only EN_* files)
-                    if doc.get('lg', '').upper() == 'EN':
-                        award_data = self._convert_meta_xml_to_standard_format(doc)
-                        if award_data:
-                            award_records.append(award_data)
-
-                # Process OTH_NOT elements with award notices (English language only)
-                for doc in root.xpath('.//OTH_NOT[@category="orig"]'):
-                    # Check if this is an award notice (natnotice code="7") AND English language
-                    # (META XML has separate files per language, so we want only EN_* files)
-                    natnotice = doc.xpath('.//natnotice[@code="7"]')
-                    if natnotice and doc.get('lg', '').upper() == 'EN':
-                        award_data = self._convert_meta_xml_to_standard_format(doc)
-                        if award_data:
-                            award_records.append(award_data)
+                with zf.open(names[0]) as xml_stream:
+                    # recover=True keeps going past invalid bytes, as the previous
+                    # decode(errors='ignore') round trip did
+                    docs = etree.iterparse(xml_stream, events=('end',), tag='doc', recover=True)
+                    for _, doc in docs:
+                        # A <doc> holds the notice in one or more languages; META XML has
+                        # separate files per language, so only English originals are
+                        # processed (EN_* files):
+                        # - CONTRACT_AWARD elements are award notices
+                        # - OTH_NOT elements are award notices if natnotice code="7"
+                        for notice in doc.iter('CONTRACT_AWARD', 'OTH_NOT'):
+                            if (
+                                notice.get('category') == 'orig'
+                                and notice.get('lg', '').upper() == 'EN'
+                                and (notice.tag == 'CONTRACT_AWARD' or notice.xpath('.//natnotice[@code="7"]'))
+                            ):
+                                award_data = self._convert_meta_xml_to_standard_format(notice)
+                                if award_data:
+                                    award_records.append(award_data)
+
+                        # Free this <doc> and the ones already processed
+                        doc.clear()
+                        while doc.getprevious() is not None:
+                            del doc.getparent()[0]
 
                 if award_records:
                     logger.debug(f"Found {len(award_records)} award records in {zip_path.name}")
@@ -152,27 +191,29 @@ class TedMetaXmlParser(BaseParser):
             doc_id = doc_parent.get('id', '')
             current_lang = doc_elem.get('lg', '')
 
-            # Extract codified data
-            codifdata = doc_elem.xpath('.//codifdata')[0] if doc_elem.xpath('.//codifdata') else None
+            # Extract codified data. codifdata, refojs and tidoc are direct children of
+            # the notice element, so they are read with find() on a fixed child path
+            # instead of a descendant search through the whole notice.
+            codifdata = doc_elem.find('codifdata')
             if codifdata is None:
                 logger.warning(f"No codified data found in document {doc_id}")
                 return None
 
             # Get document reference and metadata
-            nodocojs = codifdata.xpath('./nodocojs/text()')[0] if codifdata.xpath('./nodocojs/text()') else doc_id
-            datedisp = codifdata.xpath('./datedisp/text()')[0] if codifdata.xpath('./datedisp/text()') else ''
-            daterec = codifdata.xpath('./daterec/text()')[0] if codifdata.xpath('./daterec/text()') else ''
-            isocountry = codifdata.xpath('./isocountry/text()')[0] if codifdata.xpath('./isocountry/text()') else ''
+            nodocojs = codifdata.findtext('nodocojs') or doc_id
+            datedisp = codifdata.findtext('datedisp') or ''
+            daterec = codifdata.findtext('daterec') or ''
+            isocountry = codifdata.findtext('isocountry') or ''
 
             # Parse publication date from refojs
             pub_date = None
             datepub = ''
-            refojs = doc_elem.xpath('.//refojs')[0] if doc_elem.xpath('.//refojs') else None
+            refojs = doc_elem.find('refojs')
             if refojs is not None:
-                datepub = refojs.xpath('./datepub/text()')[0] if refojs.xpath('./datepub/text()') else ''
+                datepub = refojs.findtext('datepub') or ''
                 if datepub and len(datepub) == 8:
                     try:
-                        pub_date = datetime.strptime(datepub, '%Y%m%d').date()
+                        pub_date = parse_yyyymmdd(datepub)
                     except ValueError:
                         logger.warning(f"Invalid publication date format: {datepub}")
 
@@ -180,7 +221,7 @@ class TedMetaXmlParser(BaseParser):
             dispatch_date_obj = None
             if datedisp and len(datedisp) == 8:
                 try:
-                    dispatch_date_obj = datetime.strptime(datedisp, '%Y%m%d').date()
+                    dispatch_date_obj = parse_yyyymmdd(datedisp)
                 except ValueError:
                     pass
 
@@ -189,7 +230,7 @@ class TedMetaXmlParser(BaseParser):
 
             # Extract title from tidoc
             title = ''
-            tidoc = doc_elem.xpath('.//tidoc/p[1]/text()')
+            tidoc = doc_elem.xpath('tidoc/p[1]/text()')
             if tidoc:
                 title = tidoc[0].strip()
 
@@ -209,7 +250,7 @@ class TedMetaXmlParser(BaseParser):
 
             # Extract CPV code
             main_cpv_code = ''
-            originalcpv = codifdata.xpath('./originalcpv/@code')
+            originalcpv = codifdata.xpath('originalcpv/@code')
             if originalcpv:
                 main_cpv_code = originalcpv[0]
 
@@ -296,28 +337,15 @@ class TedMetaXmlParser(BaseParser):
         """Extract contract value from XML contents."""
         try:
             # Look for EUR amounts in text content
-            contents_text = ''
-            for text_elem in doc_elem.xpath('.//contents//text()'):
-                contents_text += text_elem + ' '
+            contents_text = ''.join(text + ' ' for text in doc_elem.xpath('.//contents//text()'))
 
             if contents_text:
-                # Simple regex to find EUR amounts
-                import re
-                value_patterns = [
-                    r'EUR\s*([\d,.\s]+)',
-                    r'€\s*([\d,.\s]+)',
-                    r'([\d,.\s]+)\s*EUR',
-                    r'([\d,.\s]+)\s*€'
-                ]
-
-                for pattern in value_patterns:
-                    match = re.search(pattern, contents_text, re.IGNORECASE)
-                    if match:
-                        value_str = match.group(1).replace(',', '').replace(' ', '')
-                        try:
-                            return float(value_str)
-                        except ValueError:
-                            continue
+                for amount in _amount_candidates(contents_text):
+                    value_str = amount.replace(',', '').replace(' ', '')
+                    try:
+                        return float(value_str)
+                    except ValueError:
+                        continue
         except Exception:
             pass
         return None
@@ -6,10 +6,10 @@ Handles R2.0.7, R2.0.8, and R2.0.9 formats (2008-2023).
 import logging
 from datetime import date
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from lxml import etree
 
-from .base import BaseParser
+from .base import BaseParser, XML_PARSER, XML_PARSER_OPTIONS
 from ..schema import (
     TedParserResultModel, TedAwardDataModel, DocumentModel,
     ContractingBodyModel, ContractModel, AwardModel, ContractorModel
@@ -17,37 +17,122 @@ from ..schema import (
 
 logger = logging.getLogger(__name__)
 
+# Elements TedV2Parser.can_parse stops at, in any namespace, and the size of the file
+# reads fed to its pull parser (iterparse reads 32 KiB at once, more than most notices)
+GATE_TAGS = ('{*}TED_EXPORT', '{*}TD_DOCUMENT_TYPE', '{*}CONTRACT_AWARD', '{*}F03_2014')
+GATE_CHUNK_SIZE = 4096
+
+
+def _iter_gate_elements(parser: etree.XMLPullParser, f):
+    """Yield GATE_TAGS elements as their start tags are read, reading the file lazily."""
+    for chunk in iter(lambda: f.read(GATE_CHUNK_SIZE), b''):
+        parser.feed(chunk)
+        for _, elem in parser.read_events():
+            yield elem
+
+
+def _any_namespace(*names: str) -> Tuple[str, ...]:
+    """Return '{*}NAME' tags, matching the names in whatever namespace the variant uses.
+
+    Passed to iter()/iterdescendants(), several tags are matched in a single walk of
+    the subtree, with the tag comparison done by lxml rather than the XPath engine.
+    """
+    return tuple(f'{{*}}{name}' for name in names)
+
+
+def _first_by_local_name(elements) -> Dict[str, etree._Element]:
+    """Map each local name to its first element (in document order) from a tag walk."""
+    first = {}
+    for elem in elements:
+        first.setdefault(etree.QName(elem).localname, elem)
+    return first
+
+
+def _element_text(elem) -> Optional[str]:
+    """Return the element's text, or None when the element is missing or empty."""
+    return elem.text if elem is not None and elem.text else None
+
+
+def _element_attr(elem, name: str) -> Optional[str]:
+    """Return an attribute of the element, or None when the element is missing."""
+    return elem.get(name) if elem is not None else None
+
+
+# Namespace-agnostic field tags, collected in one tree walk per group
+DOCUMENT_INFO_FIELDS = _any_namespace(
+    'DATE_PUB', 'DS_DATE_DISPATCH', 'RECEPTION_ID', 'NO_DOC_OJS', 'ISO_COUNTRY'
+)
+CONTRACTING_BODY_FIELDS_R209 = _any_namespace(
+    'OFFICIALNAME', 'ADDRESS', 'TOWN', 'POSTAL_CODE', 'COUNTRY', 'CONTACT_POINT',
+    'PHONE', 'E_MAIL', 'FAX', 'URL_GENERAL', 'URL_BUYER', 'CA_TYPE', 'CA_ACTIVITY'
+)
+CONTRACTOR_FIELDS_R209 = _any_namespace(
+    'OFFICIALNAME', 'ADDRESS', 'TOWN', 'POSTAL_CODE', 'COUNTRY', 'NUTS'
+)
+
 
 class TedV2Parser(BaseParser):
     """Unified parser for all TED 2.0 variants (R2.0.7, R2.0.8, R2.0.9)."""
 
+    ROOT_ELEMENTS = ('TED_EXPORT',)
+
     def can_parse(self, xml_file: Path) -> bool:
-        """Check if this file uses any TED 2.0 format variant."""
-        try:
-            tree = etree.parse(xml_file)
-            root = tree.getroot()
+        """Check if this file uses any TED 2.0 format variant.
 
-            # Check for TED_EXPORT root element (namespace-agnostic check)
-            # Different R2.0.x versions use different namespaces:
-            # - R2.0.7/R2.0.8: http://publications.europa.eu/TED_schema/Export
-            # - R2.0.9: http://publications.europa.eu/resource/schema/ted/R2.0.9/publication
-            if not root.tag.endswith('}TED_EXPORT') and root.tag != 'TED_EXPORT':
-                return False
+        The file is streamed only up to its document type (in the coded data section)
+        and, for award notices, the start of the award form, so most notices of a
+        package are rejected without parsing their form section.
+        """
+        accepted, _ = self._check(xml_file, read_tree=False)
+        return accepted
 
-            # Check if it's document type 7 (Contract award) - use namespace-agnostic xpath
-            doc_type = root.xpath('.//*[local-name()="TD_DOCUMENT_TYPE"][@CODE="7"]')
-            if not doc_type:
-                return False
+    def accept(self, xml_file: Path) -> Tuple[bool, Optional[etree._Element]]:
+        """Check the file like can_parse, reading an accepted notice to the end.
 
-            # Must have either CONTRACT_AWARD (R2.0.7/R2.0.8) or F03_2014 (R2.0.9) form
-            has_contract_award = len(root.xpath('.//*[local-name()="CONTRACT_AWARD"]')) > 0
-            has_f03_2014 = len(root.xpath('.//*[local-name()="F03_2014"]')) > 0
+        The tree started by the check is completed rather than parsed again, and its
+        root is returned for parse_root.
+        """
+        return self._check(xml_file, read_tree=True)
 
-            return has_contract_award or has_f03_2014
+    def _check(self, xml_file: Path, read_tree: bool) -> Tuple[bool, Optional[etree._Element]]:
+        """Stream the file up to its award form, optionally completing the tree."""
+        try:
+            root_seen = False
+            is_award = False
+            parser = etree.XMLPullParser(events=('start',), tag=GATE_TAGS, **XML_PARSER_OPTIONS)
+            with open(xml_file, 'rb') as f:
+                # Namespace-agnostic tags. Different R2.0.x versions use different namespaces:
+                # - R2.0.7/R2.0.8: http://publications.europa.eu/TED_schema/Export
+                # - R2.0.9: http://publications.europa.eu/resource/schema/ted/R2.0.9/publication
+                for elem in _iter_gate_elements(parser, f):
+                    tag = etree.QName(elem).localname
+
+                    # Check for TED_EXPORT root element (the root start event always comes first)
+                    if not root_seen:
+                        if tag != 'TED_EXPORT' or elem.getparent() is not None:
+                            return False, None
+                        root_seen = True
+
+                    # Check if it's document type 7 (Contract award)
+                    elif tag == 'TD_DOCUMENT_TYPE':
+                        if elem.get('CODE') != '7':
+                            return False, None
+                        is_award = True
+
+                    # Must have either CONTRACT_AWARD (R2.0.7/R2.0.8) or F03_2014 (R2.0.9) form
+                    elif tag in ('CONTRACT_AWARD', 'F03_2014'):
+                        if not is_award:
+                            return False, None
+                        if not read_tree:
+                            return True, None
+                        parser.feed(f.read())
+                        return True, parser.close()
+
+            return False, None
 
         except Exception as e:
             logger.debug(f"Error checking if {xml_file.name} is TED 2.0 format: {e}")
-            return False
+            return False, None
 
     def get_format_name(self) -> str:
         """Return the format name for this parser."""
@@ -56,9 +141,15 @@ class TedV2Parser(BaseParser):
     def parse_xml_file(self, xml_file: Path) -> Optional[TedParserResultModel]:
         """Parse a TED 2.0 XML file and extract award data."""
         try:
-            tree = etree.parse(xml_file)
-            root = tree.getroot()
+            root = etree.parse(xml_file, XML_PARSER).getroot()
+        except Exception as e:
+            logger.error(f"Error parsing TED 2.0 file {xml_file}: {e}")
+            return None
+        return self.parse_root(root, xml_file)
 
+    def parse_root(self, root: etree._Element, xml_file: Path) -> Optional[TedParserResultModel]:
+        """Extract award data from the root of an already parsed TED 2.0 file."""
+        try:
             # Detect specific variant
             variant = self._detect_variant(root)
             logger.debug(f"Processing {xml_file.name} as {variant}")
@@ -142,42 +233,45 @@ class TedV2Parser(BaseParser):
                 logger.debug(f"No edition found in {xml_file.name}")
                 return None
 
-            # Extract publication date - use namespace-agnostic xpath
-            pub_date_elems = root.xpath('.//*[local-name()="DATE_PUB"]')
-            if not pub_date_elems:
+            # Collect all document metadata elements in one namespace-agnostic pass
+            fields = _first_by_local_name(root.iterdescendants(*DOCUMENT_INFO_FIELDS))
+
+            # Extract publication date
+            pub_date_elem = fields.get('DATE_PUB')
+            if pub_date_elem is None:
                 logger.debug(f"No publication date found in {xml_file.name}")
                 return None
 
             # Parse ISO format date (YYYYMMDD from TED XML)
             try:
-                pub_date = date.fromisoformat(pub_date_elems[0].text.strip())
+                pub_date = date.fromisoformat(pub_date_elem.text.strip())
             except (ValueError, AttributeError) as e:
-                logger.error(f"Invalid publication date in {xml_file.name}: '{pub_date_elems[0].text}'. Error: {e}")
+                logger.error(f"Invalid publication date in {xml_file.name}: '{pub_date_elem.text}'. Error: {e}")
                 raise
 
-            # Extract dispatch date - use namespace-agnostic xpath
-            dispatch_date_elems = root.xpath('.//*[local-name()="DS_DATE_DISPATCH"]')
+            # Extract dispatch date
+            dispatch_date_elem = fields.get('DS_DATE_DISPATCH')
             dispatch_date = None
-            if dispatch_date_elems and dispatch_date_elems[0].text:
+            if dispatch_date_elem is not None and dispatch_date_elem.text:
                 try:
-                    dispatch_date = date.fromisoformat(dispatch_date_elems[0].text.strip())
+                    dispatch_date = date.fromisoformat(dispatch_date_elem.text.strip())
                 except (ValueError, AttributeError) as e:
-                    logger.error(f"Invalid dispatch date in {xml_file.name}: '{dispatch_date_elems[0].text}'. Error: {e}")
+                    logger.error(f"Invalid dispatch date in {xml_file.name}: '{dispatch_date_elem.text}'. Error: {e}")
                     raise
 
-            # Extract other document metadata - use namespace-agnostic xpath
-            reception_id_elems = root.xpath('.//*[local-name()="RECEPTION_ID"]')
-            no_doc_oj_elems = root.xpath('.//*[local-name()="NO_DOC_OJS"]')
-            country_elems = root.xpath('.//*[local-name()="ISO_COUNTRY"]')
+            # Extract other document metadata
+            reception_id_elem = fields.get('RECEPTION_ID')
+            no_doc_oj_elem = fields.get('NO_DOC_OJS')
+            country_elem = fields.get('ISO_COUNTRY')
 
             return {
                 'doc_id': doc_id,
                 'edition': edition,
                 'publication_date': pub_date,
                 'dispatch_date': dispatch_date,
-                'reception_id': reception_id_elems[0].text if reception_id_elems else None,
-                'official_journal_ref': no_doc_oj_elems[0].text if no_doc_oj_elems else None,
-                'source_country': country_elems[0].get('VALUE') if country_elems else None,
+                'reception_id': reception_id_elem.text if reception_id_elem is not None else None,
+                'official_journal_ref': no_doc_oj_elem.text if no_doc_oj_elem is not None else None,
+                'source_country': country_elem.get('VALUE') if country_elem is not None else None,
                 'version': variant
             }
 
@@ -252,49 +346,29 @@ class TedV2Parser(BaseParser):
 
     def _extract_contracting_body_r209(self, root) -> Optional[Dict]:
         """Extract contracting body for R2.0.9 format."""
-        # Find contracting authority in R2.0.9 format - use namespace-agnostic xpath
-        ca_elems = root.xpath('.//*[local-name()="F03_2014"]//*[local-name()="CONTRACTING_BODY"]')
-        if not ca_elems:
+        # Find contracting authority in R2.0.9 format
+        ca_elem = root.find('.//{*}F03_2014//{*}CONTRACTING_BODY')
+        if ca_elem is None:
             return None
 
-        ca_elem = ca_elems[0]
-
-        # Extract basic info - use namespace-agnostic xpath
-        name_elems = ca_elem.xpath('.//*[local-name()="OFFICIALNAME"]')
-        address_elems = ca_elem.xpath('.//*[local-name()="ADDRESS"]')
-        town_elems = ca_elem.xpath('.//*[local-name()="TOWN"]')
-        postal_code_elems = ca_elem.xpath('.//*[local-name()="POSTAL_CODE"]')
-        country_elems = ca_elem.xpath('.//*[local-name()="COUNTRY"]')
-
-        # Contact info
-        contact_elems = ca_elem.xpath('.//*[local-name()="CONTACT_POINT"]')
-        phone_elems = ca_elem.xpath('.//*[local-name()="PHONE"]')
-        email_elems = ca_elem.xpath('.//*[local-name()="E_MAIL"]')
-        fax_elems = ca_elem.xpath('.//*[local-name()="FAX"]')
-
-        # URLs
-        url_general_elems = ca_elem.xpath('.//*[local-name()="URL_GENERAL"]')
-        url_buyer_elems = ca_elem.xpath('.//*[local-name()="URL_BUYER"]')
-
-        # Authority type and activity
-        authority_type_elems = ca_elem.xpath('.//*[local-name()="CA_TYPE"]')
-        activity_elems = ca_elem.xpath('.//*[local-name()="CA_ACTIVITY"]')
+        # Collect name, address, contact, URL and activity elements in one pass
+        fields = _first_by_local_name(ca_elem.iterdescendants(*CONTRACTING_BODY_FIELDS_R209))
 
         return {
-            'official_name': name_elems[0].text if name_elems and name_elems[0].text else '',
-            'address': address_elems[0].text if address_elems and address_elems[0].text else None,
-            'town': town_elems[0].text if town_elems and town_elems[0].text else None,
-            'postal_code': postal_code_elems[0].text if postal_code_elems and postal_code_elems[0].text else None,
-            'country_code': country_elems[0].get('VALUE') if country_elems else None,
+            'official_name': _element_text(fields.get('OFFICIALNAME')) or '',
+            'address': _element_text(fields.get('ADDRESS')),
+            'town': _element_text(fields.get('TOWN')),
+            'postal_code': _element_text(fields.get('POSTAL_CODE')),
+            'country_code': _element_attr(fields.get('COUNTRY'), 'VALUE'),
             'nuts_code': None,  # Extract from NUTS if needed
-            'contact_point': contact_elems[0].text if contact_elems and contact_elems[0].text else None,
-            'phone': phone_elems[0].text if phone_elems and phone_elems[0].text else None,
-            'email': email_elems[0].text if email_elems and email_elems[0].text else None,
-            'fax': fax_elems[0].text if fax_elems and fax_elems[0].text else None,
-            'url_general': url_general_elems[0].text if url_general_elems and url_general_elems[0].text else None,
-            'url_buyer': url_buyer_elems[0].text if url_buyer_elems and url_buyer_elems[0].text else None,
-            'authority_type_code': authority_type_elems[0].get('VALUE') if authority_type_elems else None,
-            'main_activity_code': activity_elems[0].get('VALUE') if activity_elems else None
+            'contact_point': _element_text(fields.get('CONTACT_POINT')),
+            'phone': _element_text(fields.get('PHONE')),
+            'email': _element_text(fields.get('E_MAIL')),
+            'fax': _element_text(fields.get('FAX')),
+            'url_general': _element_text(fields.get('URL_GENERAL')),
+            'url_buyer': _element_text(fields.get('URL_BUYER')),
+            'authority_type_code': _element_attr(fields.get('CA_TYPE'), 'VALUE'),
+            'main_activity_code': _element_attr(fields.get('CA_ACTIVITY'), 'VALUE')
         }
 
     def _extract_contract_info(self, root, variant: str) -> Optional[Dict]:
@@ -334,22 +408,20 @@ class TedV2Parser(BaseParser):
 
     def _extract_contract_info_r209(self, root) -> Optional[Dict]:
         """Extract contract info for R2.0.9 format."""
-        # Extract from F03_2014 form - use namespace-agnostic xpath
-        object_elems = root.xpath('.//*[local-name()="F03_2014"]//*[local-name()="OBJECT_CONTRACT"]')
-        if not object_elems:
+        # Extract from F03_2014 form
+        object_elem = root.find('.//{*}F03_2014//{*}OBJECT_CONTRACT')
+        if object_elem is None:
             return None
 
-        object_elem = object_elems[0]
-
-        title_elems = object_elem.xpath('.//*[local-name()="TITLE"]')
-        description_elems = object_elem.xpath('.//*[local-name()="SHORT_DESCR"]')
+        title_elems = object_elem.findall('.//{*}TITLE')
+        description_elems = object_elem.findall('.//{*}SHORT_DESCR')
 
         # Extract CPV codes
-        cpv_main_elems = object_elem.xpath('.//*[local-name()="CPV_MAIN"]//*[local-name()="CPV_CODE"]')
-        cpv_additional_elems = object_elem.xpath('.//*[local-name()="CPV_ADDITIONAL"]//*[local-name()="CPV_CODE"]')
+        cpv_main_elems = object_elem.findall('.//{*}CPV_MAIN//{*}CPV_CODE')
+        cpv_additional_elems = object_elem.findall('.//{*}CPV_ADDITIONAL//{*}CPV_CODE')
 
         # Extract contract nature
-        type_contract_elems = object_elem.xpath('.//*[local-name()="TYPE_CONTRACT"]')
+        type_contract_elems = object_elem.findall('.//{*}TYPE_CONTRACT')
 
         return {
             'title': ''.join(title_elems[0].itertext()).strip() if title_elems else '',
@@ -377,9 +449,7 @@ class TedV2Parser(BaseParser):
         awards = []
 
         # Find all award sections
-        award_elems = root.findall('.//{http://publications.europa.eu/TED_schema/Export}AWARD_OF_CONTRACT')
-
-        for award_elem in award_elems:
+        for award_elem in root.iterdescendants('{http://publications.europa.eu/TED_schema/Export}AWARD_OF_CONTRACT'):
             # Extract basic award info
             contract_number_elem = award_elem.find('.//{http://publications.europa.eu/TED_schema/Export}CONTRACT_NUMBER')
             title_elem = award_elem.find('.//{http://publications.europa.eu/TED_schema/Export}CONTRACT_TITLE')
@@ -413,28 +483,30 @@ class TedV2Parser(BaseParser):
         """Extract awards for R2.0.9 format."""
         awards = []
 
-        # Find all award sections in F03_2014 - use namespace-agnostic xpath
-        award_elems = root.xpath('.//*[local-name()="F03_2014"]//*[local-name()="AWARD_CONTRACT"]')
+        # Find all award sections in F03_2014
+        form_elem = root.find('.//{*}F03_2014')
+        if form_elem is None:
+            return awards
 
-        for award_elem in award_elems:
+        for award_elem in form_elem.iterdescendants('{*}AWARD_CONTRACT'):
             # Extract basic award info
-            contract_number_elems = award_elem.xpath('.//*[local-name()="CONTRACT_NO"]')
-            title_elems = award_elem.xpath('.//*[local-name()="TITLE"]')
+            contract_number_elems = award_elem.findall('.//{*}CONTRACT_NO')
+            title_elems = award_elem.findall('.//{*}TITLE')
 
             # Extract award decision info
-            award_decision_elems = award_elem.xpath('.//*[local-name()="AWARDED_CONTRACT"]')
+            award_decision_elems = award_elem.findall('.//{*}AWARDED_CONTRACT')
             if not award_decision_elems:
                 continue
 
             award_decision_elem = award_decision_elems[0]
 
-            award_date_elems = award_decision_elem.xpath('.//*[local-name()="DATE_CONCLUSION_CONTRACT"]')
+            award_date_elems = award_decision_elem.findall('.//{*}DATE_CONCLUSION_CONTRACT')
 
             # Extract value
-            value_elems = award_decision_elem.xpath('.//*[local-name()="VAL_TOTAL"]')
+            value_elems = award_decision_elem.findall('.//{*}VAL_TOTAL')
 
             # Extract number of offers
-            offers_elems = award_decision_elem.xpath('.//*[local-name()="NB_TENDERS_RECEIVED"]')
+            offers_elems = award_decision_elem.findall('.//{*}NB_TENDERS_RECEIVED')
 
             # Extract contractors
             contractors = self._extract_contractors_r209(award_decision_elem)
@@ -457,9 +529,7 @@ class TedV2Parser(BaseParser):
         """Extract contractor information for R2.0.7/R2.0.8."""
         contractors = []
 
-        contractor_elems = award_elem.findall('.//{http://publications.europa.eu/TED_schema/Export}ECONOMIC_OPERATOR_NAME_ADDRESS')
-
-        for contractor_elem in contractor_elems:
+        for contractor_elem in award_elem.iterdescendants('{http://publications.europa.eu/TED_schema/Export}ECONOMIC_OPERATOR_NAME_ADDRESS'):
             contact_data_elem = contractor_elem.find('.//{http://publications.europa.eu/TED_schema/Export}CONTACT_DATA_WITHOUT_RESPONSIBLE_NAME')
             if contact_data_elem is None:
                 continue
@@ -498,24 +568,16 @@ class TedV2Parser(BaseParser):
         """Extract contractor information for R2.0.9."""
         contractors = []
 
-        # Use namespace-agnostic xpath
-        contractor_elems = award_elem.xpath('.//*[local-name()="CONTRACTOR"]')
-
-        for contractor_elem in contractor_elems:
-            name_elems = contractor_elem.xpath('.//*[local-name()="OFFICIALNAME"]')
-            address_elems = contractor_elem.xpath('.//*[local-name()="ADDRESS"]')
-            town_elems = contractor_elem.xpath('.//*[local-name()="TOWN"]')
-            postal_code_elems = contractor_elem.xpath('.//*[local-name()="POSTAL_CODE"]')
-            country_elems = contractor_elem.xpath('.//*[local-name()="COUNTRY"]')
-            nuts_elems = contractor_elem.xpath('.//*[local-name()="NUTS"]')
+        for contractor_elem in award_elem.iterdescendants('{*}CONTRACTOR'):
+            fields = _first_by_local_name(contractor_elem.iterdescendants(*CONTRACTOR_FIELDS_R209))
 
             contractor_data = {
-                'official_name': name_elems[0].text if name_elems and name_elems[0].text else '',
-                'address': address_elems[0].text if address_elems and address_elems[0].text else None,
-                'town': town_elems[0].text if town_elems and town_elems[0].text else None,
-                'postal_code': postal_code_elems[0].text if postal_code_elems and postal_code_elems[0].text else None,
-                'country_code': country_elems[0].get('VALUE') if country_elems else None,
-                'nuts_code': nuts_elems[0].get('CODE') if nuts_elems else None,
+                'official_name': _element_text(fields.get('OFFICIALNAME')) or '',
+                'address': _element_text(fields.get('ADDRESS')),
+                'town': _element_text(fields.get('TOWN')),
+                'postal_code': _element_text(fields.get('POSTAL_CODE')),
+                'country_code': _element_attr(fields.get('COUNTRY'), 'VALUE'),
+                'nuts_code': _element_attr(fields.get('NUTS'), 'CODE'),
             }
 
             contractors.append(contractor_data)
@@ -3,6 +3,7 @@ Pydantic models for TED awards data structure.
 Shared across all parsers to ensure consistent data format.
 """
 
+import sys
 from datetime import date
 from typing import ClassVar, List, Optional
 from pydantic import BaseModel, Field, field_validator, computed_field
@@ -10,6 +11,12 @@ from pydantic import BaseModel, Field, field_validator, computed_field
 from .hashing import HashableMixin
 
 
+def _intern_code(v):
+    """Intern a code value: codes repeat across notices and have few distinct values,
+    so every model of a package shares one string object per code."""
+    return sys.intern(v) if v else v
+
+
 class DocumentModel(BaseModel):
     """Document metadata model."""
     doc_id: str = Field(..., description="Document identifier")
@@ -26,7 +33,7 @@ class DocumentModel(BaseModel):
     @classmethod
     def normalize_country_code(cls, v):
         """Normalize country codes to uppercase for consistency (ISO standard)."""
-        return v.upper() if v else v
+        return sys.intern(v.upper()) if v else v
 
 
 class ContractingBodyModel(BaseModel, HashableMixin):
@@ -51,11 +58,13 @@ class ContractingBodyModel(BaseModel, HashableMixin):
     authority_type_code: Optional[str] = Field(None, description="Authority type code")
     main_activity_code: Optional[str] = Field(None, description="Main activity code")
 
+    _intern_codes = field_validator('nuts_code', 'authority_type_code', 'main_activity_code')(_intern_code)
+
     @field_validator('country_code', mode='before')
     @classmethod
     def normalize_country_code(cls, v):
         """Normalize country codes to uppercase for consistency (ISO standard)."""
-        return v.upper() if v else v
+        return sys.intern(v.upper()) if v else v
 
     @computed_field
     @property
@@ -77,6 +86,11 @@ class ContractModel(BaseModel):
     award_criteria_code: Optional[str] = Field(None, description="Award criteria code")
     performance_nuts_code: Optional[str] = Field(None, description="Performance NUTS code")
 
+    _intern_codes = field_validator(
+        'main_cpv_code', 'contract_nature_code', 'total_value_currency', 'procedure_type_code',
+        'award_criteria_code', 'performance_nuts_code'
+    )(_intern_code)
+
 
 class ContractorModel(BaseModel, HashableMixin):
     """Contractor model."""
@@ -98,11 +112,13 @@ class ContractorModel(BaseModel, HashableMixin):
     url: Optional[str] = Field(None, description="URL")
     is_sme: bool = Field(False, description="Is small/medium enterprise")
 
+    _intern_codes = field_validator('nuts_code')(_intern_code)
+
     @field_validator('country_code', mode='before')
     @classmethod
     def normalize_country_code(cls, v):
         """Normalize country codes to uppercase for consistency (ISO standard)."""
-        return v.upper() if v else v
+        return sys.intern(v.upper()) if v else v
 
     @computed_field
     @property
@@ -128,6 +144,8 @@ class AwardModel(BaseModel):
     subcontracting_description: Optional[str] = Field(None, description="Subcontracting description")
     contractors: List[ContractorModel] = Field(default_factory=list, description="List of contractors")
 
+    _intern_codes = field_validator('awarded_value_currency', 'subcontracted_value_currency')(_intern_code)
+
     @field_validator('contractors', mode='before')
     @classmethod
     def ensure_contractors_list(cls, v):
@@ -1,19 +1,33 @@
 import logging
+import multiprocessing
 import os
 import requests
+import shutil
 import tarfile
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import List, Optional
-from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from contextlib import contextmanager, nullcontext
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, select
+from pydantic import BaseModel
+from sqlalchemy import ARRAY, URL, Engine, Insert, any_, bindparam, create_engine, event, select, text
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from .parsers import ParserFactory
-from .models import Base, TEDDocument, ContractingBody, Contract, Award, Contractor
-from .schema import TedAwardDataModel, TedParserResultModel
+from .models import (
+    Base, TEDDocument, ContractingBody, Contract, Award, Contractor,
+    award_contractors, document_contracting_bodies
+)
+from .schema import (
+    TedAwardDataModel, TedParserResultModel, DocumentModel,
+    ContractingBodyModel, ContractModel, AwardModel, ContractorModel
+)
 
 load_dotenv()
 
@@ -21,28 +35,140 @@ logger = logging.getLogger(__name__)
 
 # Database setup
 DB_PATH = Path(os.getenv('DB_PATH', './tedawards.db'))
-DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+DATABASE_URL = f"sqlite:///{DB_PATH}"
 
-engine = create_engine(
-    f"sqlite:///{DB_PATH}",
-    echo=False,
-    connect_args={"check_same_thread": False}
-)
-SessionLocal = sessionmaker(bind=engine, expire_on_commit=False)
+# Rows per multi-VALUES INSERT for PostgreSQL executemany, so large award and link
+# batches take fewer round trips than SQLAlchemy's default of 1000. The dialect still
+# caps each statement at its bound parameter limit, so wide tables get smaller pages.
+PG_INSERTMANYVALUES_PAGE_SIZE = 10_000
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune SQLite for the write-heavy ingest workload on every new connection.
+
+    WAL journaling with synchronous=NORMAL avoids an fsync per commit. WAL keeps
+    `-wal` and `-shm` sidecar files next to DB_PATH while the database is open.
+    """
+    # Let SQLAlchemy emit BEGIN itself (see _begin_immediate) instead of pysqlite
+    dbapi_connection.isolation_level = None
+
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-262144")  # 256 MiB (negative = KiB)
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+def _begin_immediate(conn):
+    """Take the write lock when the transaction starts so a batch never has to upgrade it."""
+    conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+def get_sqlite_engine() -> Engine:
+    """Create the SQLite engine at DB_PATH.
+
+    The scraper is the only writer, so one shared connection (StaticPool) keeps its
+    PRAGMAs and statement cache for the whole run.
+    """
+    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+    sqlite_engine = create_engine(
+        DATABASE_URL,
+        echo=False,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    event.listen(sqlite_engine, "connect", _set_sqlite_pragmas)
+    event.listen(sqlite_engine, "begin", _begin_immediate)
+    return sqlite_engine
+
+
+def get_pg_engine() -> Engine:
+    """Create a pooled PostgreSQL engine from the DB_* environment variables.
+
+    Connections are checked with a ping on checkout and recycled before the server
+    or a proxy drops them as idle, so long scraping runs never get a dead connection.
+    Set DB_PGBOUNCER=1 when connecting through PgBouncer in transaction pooling mode:
+    consecutive transactions may then run on different server connections, so psycopg
+    must not rely on server-side prepared statements. Requires the psycopg driver.
+    """
+    connect_args = {}
+    if os.getenv('DB_PGBOUNCER') == '1':
+        connect_args['prepare_threshold'] = None
+
+    url = URL.create(
+        "postgresql+psycopg",
+        username=os.environ['DB_USER'],
+        password=os.environ['DB_PASSWORD'],
+        host=os.environ['DB_HOST'],
+        port=int(os.environ['DB_PORT']),
+        database=os.environ['DB_NAME'],
+    )
+    return create_engine(
+        url,
+        echo=False,
+        pool_size=int(os.getenv('DB_POOL_SIZE', 10)),
+        max_overflow=int(os.getenv('DB_MAX_OVERFLOW', 20)),
+        pool_recycle=int(os.getenv('DB_POOL_RECYCLE', 1800)),
+        pool_timeout=int(os.getenv('DB_POOL_TIMEOUT', 20)),
+        pool_pre_ping=True,
+        connect_args=connect_args,
+        insertmanyvalues_page_size=PG_INSERTMANYVALUES_PAGE_SIZE
+    )
+
+
+# Single engine for the process: PostgreSQL when DB_HOST is set, SQLite otherwise
+engine = get_pg_engine() if os.getenv('DB_HOST') else get_sqlite_engine()
+
+SessionLocal = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
 
 # Data directory setup
 DATA_DIR = Path(os.getenv('TED_DATA_DIR', './data'))
 DATA_DIR.mkdir(exist_ok=True)
 
+# Model fields stored in each table. Rows are read with _row_values, so fields that are
+# never written (and the computed entity_hash, which save_awards already holds) are skipped.
+DOCUMENT_FIELDS = tuple(sorted(DocumentModel.model_fields.keys() & TEDDocument.__table__.columns.keys()))
+CONTRACTING_BODY_FIELDS = tuple(sorted(ContractingBodyModel.model_fields.keys() & ContractingBody.__table__.columns.keys()))
+CONTRACT_FIELDS = tuple(sorted(ContractModel.model_fields.keys() & Contract.__table__.columns.keys()))
+AWARD_FIELDS = tuple(sorted(AwardModel.model_fields.keys() & Award.__table__.columns.keys()))
+CONTRACTOR_FIELDS = tuple(sorted(ContractorModel.model_fields.keys() & Contractor.__table__.columns.keys()))
+
+# Upper bound on contracting body and contractor ids carried between the packages of a
+# scrape_year run (each entry is a 16-char hash and an int, roughly 150 bytes)
+ENTITY_ID_CACHE_SIZE = 100_000
+
+# Files handed to a parse worker per task, so pickling overhead does not dominate the
+# roughly one millisecond it takes to parse a TED 2.0 or eForms notice
+PARSE_CHUNK_SIZE = 32
+
 # Parser factory (module-level singleton)
 parser_factory = ParserFactory()
 
 
+@lru_cache(maxsize=None)
+def _ensure_schema(bind: Engine) -> None:
+    """Create any missing tables, once per engine for the life of the process."""
+    Base.metadata.create_all(bind)
+
+
 @contextmanager
-def get_session() -> Session:
-    """Get database session as context manager."""
+def get_session(durable: bool = True) -> Session:
+    """Get database session as context manager.
+
+    Args:
+        durable: If False, PostgreSQL acknowledges the commit before its WAL record is
+            flushed (synchronous_commit=off). A crash can lose the last few commits but
+            never corrupts the database. SQLite ignores this: in WAL mode with
+            synchronous=NORMAL its commits already skip the fsync.
+    """
     session = SessionLocal()
     try:
+        if not durable and engine.dialect.name == 'postgresql':
+            session.execute(text("SET LOCAL synchronous_commit = OFF"))
         yield session
         session.commit()
     except Exception:
@@ -52,6 +178,18 @@ def get_session() -> Session:
         session.close()
 
 
+def refresh_award_denorm() -> None:
+    """Refresh the v_award_denorm materialized view after a load.
+
+    Only PostgreSQL materializes the view; on SQLite it is a plain view that is always
+    current. CONCURRENTLY keeps the view readable while it is rebuilt.
+    """
+    if engine.dialect.name != 'postgresql':
+        return
+    with get_session() as session:
+        session.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY v_award_denorm"))
+
+
 def get_package_number(year: int, issue: int) -> int:
     """Calculate TED package number from year and OJ issue number."""
     return year * 100000 + issue
@@ -151,13 +289,17 @@ def process_file(file_path: Path) -> TedParserResultModel:
     """Process a single file (XML or ZIP) and return parser result."""
     try:
         # Get appropriate parser for this file
-        parser = parser_factory.get_parser(file_path)
+        parser, root = parser_factory.detect(file_path)
         if not parser:
             logger.debug(f"No parser available for {file_path.name}")
             return None
 
-        # Parse file - returns TedParserResultModel
-        result = parser.parse_xml_file(file_path)
+        # Parse file - returns TedParserResultModel; a root already read by detection
+        # is extracted directly instead of parsing the file again
+        if root is not None:
+            result = parser.parse_root(root, file_path)
+        else:
+            result = parser.parse_xml_file(file_path)
         if not result:
             logger.debug(f"Failed to parse {file_path.name} with {parser.get_format_name()}")
             return None
@@ -170,118 +312,357 @@ def process_file(file_path: Path) -> TedParserResultModel:
         raise
 
 
-def save_awards(session: Session, awards: List[TedAwardDataModel]) -> int:
-    """Save award data to database with proper deduplication using RETURNING."""
-    count = 0
-    insert_func = sqlite_insert if engine.dialect.name == 'sqlite' else pg_insert
+@lru_cache(maxsize=None)
+def _bulk_statements(dialect_name: str) -> Dict[str, Any]:
+    """Build the save_awards statements once per dialect so every batch reuses them.
 
-    for award_data in awards:
-        try:
-            # Insert/update document with RETURNING to get doc_id
-            doc_values = award_data.document.model_dump()
-            stmt = insert_func(TEDDocument).values(**doc_values)
-            stmt = stmt.on_conflict_do_update(
-                index_elements=['doc_id'],
-                set_={'doc_id': stmt.excluded.doc_id}  # No-op update to trigger RETURNING
-            ).returning(TEDDocument.doc_id)
-            doc_id = session.execute(stmt).scalar_one()
-
-            # Insert/update contracting body with RETURNING to get id
-            cb_data = award_data.contracting_body.model_dump()
-            cb_hash = award_data.contracting_body.entity_hash
-            cb_data['entity_hash'] = cb_hash
-
-            stmt = insert_func(ContractingBody).values(**cb_data)
-            stmt = stmt.on_conflict_do_update(
-                index_elements=['entity_hash'],
-                set_={'entity_hash': stmt.excluded.entity_hash}  # No-op update
-            ).returning(ContractingBody.id)
-            cb_id = session.execute(stmt).scalar_one()
-
-            # Insert document-contracting body relationship with INSERT OR IGNORE
-            from .models import document_contracting_bodies
-            stmt = insert_func(document_contracting_bodies).values(
-                ted_doc_id=doc_id,
-                contracting_body_id=cb_id
-            )
-            stmt = stmt.on_conflict_do_nothing()
-            session.execute(stmt)
-
-            # Insert/update contract with RETURNING to get id
-            contract_data = award_data.contract.model_dump()
-            contract_data['ted_doc_id'] = doc_id
-            contract_data['contracting_body_id'] = cb_id
-            contract_data.pop('performance_nuts_code', None)
-
-            stmt = insert_func(Contract).values(**contract_data)
-            stmt = stmt.on_conflict_do_update(
-                index_elements=['ted_doc_id', 'title'],
-                set_={'ted_doc_id': stmt.excluded.ted_doc_id}  # No-op update
-            ).returning(Contract.id)
-            contract_id = session.execute(stmt).scalar_one()
-
-            # Insert awards and contractors
+    Statements target the Core tables so executemany skips the ORM bulk-insert layer,
+    and lookups bind their whole key list as one parameter instead of embedding literal
+    lists: a single array compared with = ANY on PostgreSQL, so the SQL text is the same
+    for every batch size, and an expanding IN list on SQLite, which has no arrays.
+    """
+    insert_func = sqlite_insert if dialect_name == 'sqlite' else pg_insert
+
+    def in_list(column, name):
+        if dialect_name == 'postgresql':
+            return column == any_(bindparam(name, type_=ARRAY(column.type)))
+        return column.in_(bindparam(name, expanding=True))
+
+    documents_table = TEDDocument.__table__
+    bodies_table = ContractingBody.__table__
+    contracts_table = Contract.__table__
+    awards_table = Award.__table__
+    contractors_table = Contractor.__table__
+
+    stmts = {}
+    stmts['select_documents'] = (
+        select(documents_table.c.doc_id)
+        .where(in_list(documents_table.c.doc_id, 'doc_ids'))
+    )
+    stmts['insert_documents'] = insert_func(documents_table).on_conflict_do_nothing()
+
+    stmts['select_bodies'] = (
+        select(bodies_table.c.entity_hash, bodies_table.c.id)
+        .where(in_list(bodies_table.c.entity_hash, 'hashes'))
+    )
+    stmt = insert_func(bodies_table)
+    stmts['upsert_bodies'] = stmt.on_conflict_do_update(
+        index_elements=['entity_hash'],
+        set_={'entity_hash': stmt.excluded.entity_hash}  # No-op update to trigger RETURNING
+    ).returning(bodies_table.c.entity_hash, bodies_table.c.id)
+
+    stmts['insert_document_bodies'] = insert_func(document_contracting_bodies).on_conflict_do_nothing()
+
+    stmt = insert_func(contracts_table)
+    stmts['upsert_contracts'] = stmt.on_conflict_do_update(
+        index_elements=['ted_doc_id', 'title'],
+        set_={'ted_doc_id': stmt.excluded.ted_doc_id}  # No-op update
+    ).returning(contracts_table.c.ted_doc_id, contracts_table.c.title, contracts_table.c.id)
+
+    stmt = insert_func(awards_table)
+    stmts['upsert_awards'] = stmt.on_conflict_do_update(
+        index_elements=['contract_id', 'award_title', 'conclusion_date'],
+        set_={'contract_id': stmt.excluded.contract_id}  # No-op update
+    ).returning(
+        awards_table.c.contract_id, awards_table.c.award_title,
+        awards_table.c.conclusion_date, awards_table.c.id
+    )
+    stmts['insert_awards'] = insert_func(awards_table).returning(
+        awards_table.c.id, sort_by_parameter_order=True
+    )
+
+    stmts['select_contractors'] = (
+        select(contractors_table.c.entity_hash, contractors_table.c.id)
+        .where(in_list(contractors_table.c.entity_hash, 'hashes'))
+    )
+    stmt = insert_func(contractors_table)
+    stmts['upsert_contractors'] = stmt.on_conflict_do_update(
+        index_elements=['entity_hash'],
+        set_={'entity_hash': stmt.excluded.entity_hash}  # No-op update
+    ).returning(contractors_table.c.entity_hash, contractors_table.c.id)
+
+    stmts['insert_award_contractors'] = insert_func(award_contractors).on_conflict_do_nothing()
+
+    return stmts
+
+
+def documents_exist(session: Session, doc_ids: Iterable[str]) -> Set[str]:
+    """Return the subset of doc_ids already stored, answered with a single query."""
+    doc_ids = list(doc_ids)
+    if not doc_ids:
+        return set()
+    stmt = _bulk_statements(session.get_bind().dialect.name)['select_documents']
+    return set(session.execute(stmt, {'doc_ids': doc_ids}).scalars())
+
+
+def _row_values(model: BaseModel, fields: Tuple[str, ...]) -> Dict[str, Any]:
+    """Return the given fields of a model as a column dict for executemany.
+
+    The stored fields are flat scalars, so reading them straight from the pydantic
+    instance __dict__ gives the same values as model_dump at about a third of the cost.
+    """
+    values = model.__dict__
+    return {field: values[field] for field in fields}
+
+
+def _row_tuple(model: BaseModel, fields: Tuple[str, ...]) -> tuple:
+    """Return the given fields of a model as a tuple in fields order (see _row_values)."""
+    values = model.__dict__
+    return tuple(values[field] for field in fields)
+
+
+def _copy_insert(session: Session, stmt: Insert, columns: Tuple[str, ...], rows: Iterable[tuple]) -> None:
+    """Insert rows, given as tuples of column values, skipping the ones that already exist.
+
+    On PostgreSQL the rows are streamed with COPY into a temporary staging table and
+    moved over with one INSERT ... SELECT ... ON CONFLICT DO NOTHING, since COPY cannot
+    skip conflicts itself. Other dialects run the prepared executemany insert.
+    """
+    table = stmt.table
+
+    if session.get_bind().dialect.name != 'postgresql':
+        session.execute(stmt, [dict(zip(columns, row)) for row in rows])
+        return
+
+    column_list = ', '.join(columns)
+    staging = f"staging_{table.name}"
+    connection = session.connection()
+    # Only the copied columns, without constraints: LIKE would carry over NOT NULL
+    # columns such as ted_documents.created_at, which COPY leaves empty
+    connection.exec_driver_sql(
+        f"CREATE TEMP TABLE IF NOT EXISTS {staging} ON COMMIT DELETE ROWS "
+        f"AS SELECT {column_list} FROM {table.name} WITH NO DATA"
+    )
+    with connection.connection.cursor() as cursor:
+        with cursor.copy(f"COPY {staging} ({column_list}) FROM STDIN") as copy:
+            for row in rows:
+                copy.write_row(row)
+    connection.exec_driver_sql(
+        f"INSERT INTO {table.name} ({column_list}, created_at) "
+        f"SELECT {column_list}, now() FROM {staging} ON CONFLICT DO NOTHING"
+    )
+    # Later chunks of the same transaction reuse the staging table
+    connection.exec_driver_sql(f"TRUNCATE {staging}")
+
+
+def _insert_link_rows(session: Session, stmt: Insert, rows: Set[tuple]) -> None:
+    """Insert association table rows, given as primary key tuples, skipping existing ones."""
+    columns = tuple(column.name for column in stmt.table.primary_key.columns)
+    _copy_insert(session, stmt, columns, rows)
+
+
+def save_awards(
+    session: Session,
+    awards: List[TedAwardDataModel],
+    body_ids: Optional[Dict[str, int]] = None,
+    contractor_ids: Optional[Dict[str, int]] = None
+) -> int:
+    """Save award data to database in bulk with proper deduplication.
+
+    Documents already stored are skipped entirely: a document is committed together
+    with all of its contracts and awards, so there is nothing left to write for it.
+    Each table is written with a single executemany upsert whose RETURNING clause maps
+    every natural key to its surrogate id. Contracting bodies and contractors recur
+    across packages, so their known ids are looked up first and only new rows are written.
+
+    Args:
+        session: Session whose transaction receives the writes
+        awards: Award notices to save
+        body_ids: Contracting body ids already resolved in this transaction, keyed by
+            entity_hash. Bodies found here are not looked up again; newly resolved
+            ones are added in place.
+        contractor_ids: Contractor ids already resolved in this transaction, used and
+            filled the same way as body_ids.
+
+    Returns the number of award notices processed, including skipped ones.
+    """
+    if not awards:
+        return 0
+
+    processed = len(awards)
+    stored = documents_exist(session, (award_data.document.doc_id for award_data in awards))
+    if stored:
+        awards = [award_data for award_data in awards if award_data.document.doc_id not in stored]
+        logger.debug(f"Skipping {processed - len(awards)} award notices already in the database")
+        if not awards:
+            return processed
+
+    dialect_name = session.get_bind().dialect.name
+    stmts = _bulk_statements(dialect_name)
+
+    if dialect_name == 'sqlite':
+        # Check foreign keys once at commit instead of after every statement
+        session.execute(text("PRAGMA defer_foreign_keys=ON"))
+
+    try:
+        # Documents: doc_id is the primary key, so no id lookup is needed and nothing
+        # has to be returned, which lets PostgreSQL load them with COPY
+        documents = {}
+        for award_data in awards:
+            if award_data.document.doc_id not in documents:
+                documents[award_data.document.doc_id] = _row_tuple(award_data.document, DOCUMENT_FIELDS)
+        _copy_insert(session, stmts['insert_documents'], DOCUMENT_FIELDS, documents.values())
+
+        # Contracting bodies are a bounded set that recurs across documents: resolve the
+        # known ones with a single SELECT and only insert the misses. entity_hash is
+        # recomputed on every access, so it is taken once per notice and reused below.
+        cb_ids = body_ids if body_ids is not None else {}
+        body_hashes = [award_data.contracting_body.entity_hash for award_data in awards]
+        bodies = {}
+        for cb_hash, award_data in zip(body_hashes, awards):
+            if cb_hash not in cb_ids:
+                bodies.setdefault(cb_hash, award_data.contracting_body)
+        if bodies:
+            cb_ids.update(session.execute(stmts['select_bodies'], {'hashes': list(bodies)}).all())
+            missing = [
+                {**_row_values(body, CONTRACTING_BODY_FIELDS), 'entity_hash': cb_hash}
+                for cb_hash, body in bodies.items()
+                if cb_hash not in cb_ids
+            ]
+            if missing:
+                cb_ids.update(session.execute(stmts['upsert_bodies'], missing).all())
+
+        # Document-contracting body relationships
+        document_bodies = {
+            (award_data.document.doc_id, cb_ids[cb_hash])
+            for cb_hash, award_data in zip(body_hashes, awards)
+        }
+        _insert_link_rows(session, stmts['insert_document_bodies'], document_bodies)
+
+        # Contracts: unique per (ted_doc_id, title)
+        contracts = {}
+        for cb_hash, award_data in zip(body_hashes, awards):
+            contract_data = _row_values(award_data.contract, CONTRACT_FIELDS)
+            contract_data['ted_doc_id'] = award_data.document.doc_id
+            contract_data['contracting_body_id'] = cb_ids[cb_hash]
+            contracts.setdefault((contract_data['ted_doc_id'], contract_data['title']), contract_data)
+        contract_ids = {
+            (ted_doc_id, title): contract_id
+            for ted_doc_id, title, contract_id
+            in session.execute(stmts['upsert_contracts'], list(contracts.values()))
+        }
+
+        # Awards: unique per (contract_id, award_title, conclusion_date). SQL treats NULLs
+        # as distinct, so awards with a NULL key part never conflict and are always inserted;
+        # their ids are taken from RETURNING in parameter order instead of by natural key.
+        keyed_awards = {}
+        unkeyed_awards = []
+        award_items = []
+        for award_data in awards:
+            contract_id = contract_ids[(award_data.document.doc_id, award_data.contract.title)]
             for award_item in award_data.awards:
-                award_dict = award_item.model_dump()
-                contractors_data = award_dict.pop('contractors', [])
+                award_dict = _row_values(award_item, AWARD_FIELDS)
                 award_dict['contract_id'] = contract_id
+                key = (contract_id, award_dict['award_title'], award_dict['conclusion_date'])
+                if None in key:
+                    award_items.append((len(unkeyed_awards), award_item))
+                    unkeyed_awards.append(award_dict)
+                else:
+                    award_items.append((key, award_item))
+                    keyed_awards.setdefault(key, award_dict)
+
+        award_ids = {}
+        if keyed_awards:
+            award_ids.update(
+                ((contract_id, award_title, conclusion_date), award_id)
+                for contract_id, award_title, conclusion_date, award_id
+                in session.execute(stmts['upsert_awards'], list(keyed_awards.values()))
+            )
+        if unkeyed_awards:
+            returned_ids = session.execute(stmts['insert_awards'], unkeyed_awards).scalars().all()
+            award_ids.update(enumerate(returned_ids))
+
+        # Contractors recur across awards and packages: resolve the known ones with a
+        # single SELECT and only insert the misses, so existing rows are not rewritten
+        if contractor_ids is None:
+            contractor_ids = {}
+        contractors = {}
+        award_contractor_hashes = []
+        for award_key, award_item in award_items:
+            for contractor_item in award_item.contractors:
+                contractor_hash = contractor_item.entity_hash
+                if contractor_hash not in contractor_ids:
+                    contractors.setdefault(contractor_hash, contractor_item)
+                award_contractor_hashes.append((award_key, contractor_hash))
+        if contractors:
+            contractor_ids.update(
+                session.execute(stmts['select_contractors'], {'hashes': list(contractors)}).all()
+            )
+            missing = [
+                {**_row_values(contractor_item, CONTRACTOR_FIELDS), 'entity_hash': entity_hash}
+                for entity_hash, contractor_item in contractors.items()
+                if entity_hash not in contractor_ids
+            ]
+            if missing:
+                contractor_ids.update(session.execute(stmts['upsert_contractors'], missing).all())
+
+        # Award-contractor relationships
+        award_contractor_links = {
+            (award_ids[award_key], contractor_ids[contractor_hash])
+            for award_key, contractor_hash in award_contractor_hashes
+        }
+        if award_contractor_links:
+            _insert_link_rows(session, stmts['insert_award_contractors'], award_contractor_links)
 
-                # Insert/update award with RETURNING to get id
-                stmt = insert_func(Award).values(**award_dict)
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=['contract_id', 'award_title', 'conclusion_date'],
-                    set_={'contract_id': stmt.excluded.contract_id}  # No-op update
-                ).returning(Award.id)
-                award_id = session.execute(stmt).scalar_one()
-
-                # Insert contractors and link to awards
-                for contractor_item in award_item.contractors:
-                    contractor_data = contractor_item.model_dump()
-                    contractor_hash = contractor_item.entity_hash
-                    contractor_data['entity_hash'] = contractor_hash
-
-                    stmt = insert_func(Contractor).values(**contractor_data)
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=['entity_hash'],
-                        set_={'entity_hash': stmt.excluded.entity_hash}  # No-op update
-                    ).returning(Contractor.id)
-                    contractor_id = session.execute(stmt).scalar_one()
-
-                    # Insert award-contractor relationship with INSERT OR IGNORE
-                    from .models import award_contractors
-                    stmt = insert_func(award_contractors).values(
-                        award_id=award_id,
-                        contractor_id=contractor_id
-                    )
-                    stmt = stmt.on_conflict_do_nothing()
-                    session.execute(stmt)
-
-            count += 1
+    except Exception as e:
+        logger.error(f"Error saving batch of {len(awards)} award notices: {e}")
+        raise
 
-        except Exception as e:
-            logger.error(f"Error saving award {award_data.document.doc_id}: {e}")
-            raise
+    return processed
 
-    session.flush()
-    return count
 
+def save_awards_stream(
+    session: Session,
+    awards: Iterable[TedAwardDataModel],
+    chunk_size: int = 500,
+    body_ids: Optional[Dict[str, int]] = None,
+    contractor_ids: Optional[Dict[str, int]] = None
+) -> int:
+    """Save award notices in chunks of chunk_size so only one chunk is held in memory.
 
-def scrape_package(package_number: int, data_dir: Path = DATA_DIR) -> int:
-    """Scrape TED awards for a specific package number. Returns number of awards processed.
+    All chunks share the session's transaction, so a package is still committed or
+    rolled back as a whole. Documents and entities written by an earlier chunk are
+    found by the lookups of later ones; contracting body and contractor ids are
+    carried between chunks so recurring entities are not looked up again.
 
     Args:
-        package_number: TED package number to scrape
-        data_dir: Directory for storing downloaded packages
+        session: Session whose transaction receives the writes
+        awards: Award notices to save
+        chunk_size: Number of award notices saved per save_awards call
+        body_ids: Known contracting body ids, filled in place (see save_awards)
+        contractor_ids: Known contractor ids, filled in place (see save_awards)
 
-    Returns:
-        Number of awards processed
+    Returns the number of award notices processed.
     """
-    # Download and extract daily package
-    files = download_and_extract(package_number, data_dir)
-    if files is None:
-        return 0
+    awards = iter(awards)
+    if body_ids is None:
+        body_ids = {}
+    if contractor_ids is None:
+        contractor_ids = {}
+    processed = 0
+    while chunk := list(islice(awards, chunk_size)):
+        processed += save_awards(session, chunk, body_ids, contractor_ids)
+    return processed
+
+
+def get_parse_pool(parse_workers: int):
+    """Return a context manager for the process pool that parses package files.
+
+    Parsing is CPU bound and files share no state, so with more than one worker the
+    files of a package are parsed in separate processes. Workers are spawned rather
+    than forked, as the download threads are already running. With a single worker
+    the context yields None and files are parsed in this process.
+    """
+    if parse_workers <= 1:
+        return nullcontext()
+    return ProcessPoolExecutor(max_workers=parse_workers, mp_context=multiprocessing.get_context('spawn'))
+
+
+def iter_package_awards(files: List[Path], parse_pool: Optional[Executor] = None) -> Iterator[TedAwardDataModel]:
+    """Parse package files and yield their award notices in file order.
 
-    # Process all files and collect awards
+    Files are parsed one at a time, or across parse_pool (see get_parse_pool) when given.
+    """
     # Filter for English-only files to avoid processing all language variants
     english_files = [
         f for f in files
@@ -297,34 +678,65 @@ def scrape_package(package_number: int, data_dir: Path = DATA_DIR) -> int:
         )
     ]
 
-    all_awards = []
-    for file_path in english_files:
-        parser_result = process_file(file_path)
+    if parse_pool is None:
+        parser_results = map(process_file, english_files)
+    else:
+        parser_results = parse_pool.map(process_file, english_files, chunksize=PARSE_CHUNK_SIZE)
+
+    for parser_result in parser_results:
         if parser_result:
-            all_awards.extend(parser_result.awards)
-
-    # Save all awards in a single transaction
-    if all_awards:
-        with get_session() as session:
-            saved = save_awards(session, all_awards)
-            logger.info(f"Package {package_number:09d}: Processed {saved} award notices")
-            return saved
+            yield from parser_result.awards
+
+
+def scrape_package(package_number: int, data_dir: Path = DATA_DIR, durable: bool = True, parse_workers: int = 1) -> int:
+    """Scrape TED awards for a specific package number. Returns number of awards processed.
+
+    Args:
+        package_number: TED package number to scrape
+        data_dir: Directory for storing downloaded packages
+        durable: If False, commit without waiting for the WAL flush (see get_session)
+        parse_workers: Number of processes parsing the package files (see get_parse_pool)
+
+    Returns:
+        Number of awards processed
+    """
+    _ensure_schema(engine)
+
+    # Download and extract daily package
+    files = download_and_extract(package_number, data_dir)
+    if files is None:
+        return 0
+
+    # Parse and save all awards in a single transaction
+    with get_parse_pool(parse_workers) as parse_pool, get_session(durable) as session:
+        saved = save_awards_stream(session, iter_package_awards(files, parse_pool))
+
+    if saved:
+        logger.info(f"Package {package_number:09d}: Processed {saved} award notices")
+        refresh_award_denorm()
     else:
         logger.debug(f"Package {package_number:09d}: No award notices found")
-        return 0
+    return saved
 
 
-def scrape_year(year: int, start_issue: Optional[int] = None, max_issue: int = 300, data_dir: Path = DATA_DIR, force_reimport: bool = False):
+def scrape_year(year: int, start_issue: Optional[int] = None, max_issue: int = 300, data_dir: Path = DATA_DIR, force_reimport: bool = False, durable: bool = True, workers: int = 1, parse_workers: int = 1):
     """Scrape TED awards for all available packages in a year.
 
+    Packages are downloaded by a pool of worker threads ahead of the package being
+    parsed and saved, so network transfers overlap with processing. Saving stays
+    sequential, one transaction per package.
+
     Args:
         year: The year to scrape
         start_issue: Starting OJ issue number (default: auto-resume from last downloaded issue + 1, or 1 if none)
         max_issue: Maximum issue number to try (default: 300, sufficient for most years)
         data_dir: Directory for storing downloaded packages
         force_reimport: If True, reimport data from all already-downloaded archives (starting from issue 1)
+        durable: If False, commit each package without waiting for the WAL flush (see get_session)
+        workers: Number of packages downloaded ahead concurrently (TED allows 3 concurrent downloads)
+        parse_workers: Number of processes parsing package files (see get_parse_pool)
     """
-    Base.metadata.create_all(engine)
+    _ensure_schema(engine)
 
     # Auto-resume from last downloaded issue if start_issue not specified (unless force_reimport)
     if start_issue is None:
@@ -346,55 +758,93 @@ def scrape_year(year: int, start_issue: Optional[int] = None, max_issue: int = 3
     consecutive_404s = 0
     max_consecutive_404s = 10  # Stop after 10 consecutive 404s
 
-    for issue in range(start_issue, max_issue + 1):
-        package_number = get_package_number(year, issue)
-
-        # Download and extract package
-        files = download_and_extract(package_number, data_dir)
-
-        if files is None:
-            # Package doesn't exist (404)
-            consecutive_404s += 1
-            if consecutive_404s >= max_consecutive_404s:
-                logger.info(f"Stopping after {max_consecutive_404s} consecutive 404s at issue {issue}")
-                break
-            continue
-
-        # Reset 404 counter on success
-        consecutive_404s = 0
-
-        # Process all files and collect awards
-        english_files = [
-            f for f in files
-            if (
-                # TED META XML: en_*_meta_org.zip or EN_*_META_ORG.ZIP
-                f.name.lower().startswith('en_') and '_meta_org.' in f.name.lower()
-            ) or (
-                # TED INTERNAL_OJS: *.en files
-                f.suffix.lower() == '.en'
-            ) or (
-                # TED 2.0 and eForms: all languages in one file (*.xml)
-                f.suffix.lower() == '.xml'
-            )
-        ]
+    issues = iter(range(start_issue, max_issue + 1))
+    downloads = deque()
+
+    # Contracting body and contractor ids committed by earlier packages of this run.
+    # These rows are never deleted, so each package starts from a copy of the known ids
+    # and only looks up entities it has not seen; the copy replaces the cache only
+    # once its package has committed, so a rolled back package leaves no stale ids.
+    body_ids = {}
+    contractor_ids = {}
+
+    with ThreadPoolExecutor(max_workers=workers) as executor, get_parse_pool(parse_workers) as parse_pool:
+        def schedule_download():
+            issue = next(issues, None)
+            if issue is not None:
+                package_number = get_package_number(year, issue)
+                existed = (data_dir / f"{package_number:09d}").exists()
+                downloads.append((issue, executor.submit(download_and_extract, package_number, data_dir), existed))
+
+        def discard_downloads_ahead():
+            """Remove the queued packages this run downloaded but did not save.
+
+            Auto-resume starts after the last package directory on disk, so a package
+            left behind when saving fails, the run is interrupted or the 404 cutoff is
+            reached would never be imported. Directories that existed before the run
+            are kept.
+            """
+            for _, pending, _ in downloads:
+                pending.cancel()
+            for issue, pending, existed in downloads:
+                if existed or pending.cancelled():
+                    continue
+                wait([pending])
+                package_str = f"{get_package_number(year, issue):09d}"
+                shutil.rmtree(data_dir / package_str, ignore_errors=True)
+                (data_dir / f"{package_str}.tar.gz").unlink(missing_ok=True)
+
+        for _ in range(workers):
+            schedule_download()
 
-        all_awards = []
-        for file_path in english_files:
-            parser_result = process_file(file_path)
-            if parser_result:
-                all_awards.extend(parser_result.awards)
+        try:
+            while downloads:
+                # A package stays queued until it is saved, so it is discarded with the
+                # downloads ahead of it if saving fails
+                issue, download, _ = downloads[0]
+                package_number = get_package_number(year, issue)
+
+                # Keep the download queue full while this package is processed
+                schedule_download()
+                files = download.result()
+
+                if files is None:
+                    # Package doesn't exist (404)
+                    downloads.popleft()
+                    consecutive_404s += 1
+                    if consecutive_404s >= max_consecutive_404s:
+                        logger.info(f"Stopping after {max_consecutive_404s} consecutive 404s at issue {issue}")
+                        break
+                    continue
+
+                # Reset 404 counter on success
+                consecutive_404s = 0
+
+                # Parse and save all awards in a single transaction
+                package_body_ids = dict(body_ids)
+                package_contractor_ids = dict(contractor_ids)
+                with get_session(durable) as session:
+                    saved = save_awards_stream(
+                        session, iter_package_awards(files, parse_pool),
+                        body_ids=package_body_ids, contractor_ids=package_contractor_ids
+                    )
+                body_ids = package_body_ids if len(package_body_ids) <= ENTITY_ID_CACHE_SIZE else {}
+                contractor_ids = package_contractor_ids if len(package_contractor_ids) <= ENTITY_ID_CACHE_SIZE else {}
+                downloads.popleft()
 
-        # Save all awards in a single transaction
-        if all_awards:
-            with get_session() as session:
-                saved = save_awards(session, all_awards)
-                total_processed += saved
-                logger.info(f"Package {package_number:09d}: Processed {saved} award notices")
+                if saved:
+                    total_processed += saved
+                    logger.info(f"Package {package_number:09d}: Processed {saved} award notices")
+        finally:
+            discard_downloads_ahead()
+
+    if total_processed:
+        refresh_award_denorm()
 
     logger.info(f"Year {year} completed: Processed {total_processed} total award notices")
 
 
-def scrape_year_range(start_year: int, end_year: int, data_dir: Path = DATA_DIR, force_reimport: bool = False):
+def scrape_year_range(start_year: int, end_year: int, data_dir: Path = DATA_DIR, force_reimport: bool = False, durable: bool = True, workers: int = 1, parse_workers: int = 1):
     """Scrape TED awards for a range of years.
 
     Args:
@@ -402,12 +852,13 @@ def scrape_year_range(start_year: int, end_year: int, data_dir: Path = DATA_DIR,
         end_year: Last year to scrape (inclusive)
         data_dir: Directory for storing downloaded packages
         force_reimport: If True, reprocess already-downloaded archives
+        durable: If False, commit each package without waiting for the WAL flush (see get_session)
+        workers: Number of packages downloaded ahead concurrently
+        parse_workers: Number of processes parsing package files
     """
-    Base.metadata.create_all(engine)
-
     logger.info(f"Scraping TED awards from {start_year} to {end_year}")
 
     for year in range(start_year, end_year + 1):
-        scrape_year(year, data_dir=data_dir, force_reimport=force_reimport)
+        scrape_year(year, data_dir=data_dir, force_reimport=force_reimport, durable=durable, workers=workers, parse_workers=parse_workers)
 
     logger.info("Scraping completed")
\ No newline at end of file
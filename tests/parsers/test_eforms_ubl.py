@@ -10,9 +10,14 @@ These tests validate:
 """
 
 import pytest
+from datetime import date
 from pathlib import Path
 
-from tedawards.parsers.eforms_ubl import EFormsUBLParser
+from lxml import etree
+
+from tedawards.parsers.eforms_ubl import (
+    EFormsUBLParser, COMPANY_FIELDS, NAMESPACES, NOTICE_PATHS, _notice_elements, _read_fields
+)
 from tedawards.schema import (
     TedParserResultModel, TedAwardDataModel, DocumentModel,
     ContractingBodyModel, ContractModel, AwardModel, ContractorModel
@@ -88,6 +93,63 @@ class TestEFormsUBLParser:
                 assert isinstance(contractor, ContractorModel)
                 assert contractor.official_name, f"Contractor name should be present in {fixture_name}"
 
+    @pytest.mark.parametrize("fixture_name", EFORMS_UBL_FIXTURES)
+    def test_publication_date_prefers_publication_element(self, parser, fixture_name):
+        """Test that efbc:PublicationDate wins over the earlier notice IssueDate."""
+        result = parser.parse_xml_file(FIXTURES_DIR / fixture_name)
+
+        assert result.awards[0].document.publication_date == date(2025, 1, 2)
+
+    def test_doc_id_from_file_name(self, parser, tmp_path):
+        """Test that the year suffix of the file name is joined with a dash."""
+        notice = tmp_path / "00012345_2025.xml"
+        notice.write_bytes((FIXTURES_DIR / "eforms_ubl_2025.xml").read_bytes())
+
+        result = parser.parse_xml_file(notice)
+
+        assert result.awards[0].document.doc_id == "00012345-2025"
+
+    def test_one_award_per_lot_result(self, parser, tmp_path):
+        """Test that every LotResult of a notice becomes an award."""
+        xml = (FIXTURES_DIR / "eforms_ubl_2025_alt.xml").read_text(encoding="utf-8")
+        start = xml.index("<efac:LotResult>")
+        end = xml.index("</efac:LotResult>") + len("</efac:LotResult>")
+        notice = tmp_path / "00012345_2025.xml"
+        notice.write_text(xml[:start] + xml[start:end] * 3 + xml[end:], encoding="utf-8")
+
+        awards = parser.parse_xml_file(notice).awards[0].awards
+
+        assert len(awards) == 3
+        assert awards[0] == awards[1] == awards[2]
+        assert awards[0].contractors
+
+    @pytest.mark.parametrize("fixture_name", EFORMS_UBL_FIXTURES)
+    def test_notice_elements_match_xpath(self, fixture_name):
+        """Test that the single-walk lookups find the same elements as .//path XPaths."""
+        root = etree.parse(str(FIXTURES_DIR / fixture_name)).getroot()
+
+        found = _notice_elements(root)
+
+        for name, path in NOTICE_PATHS.items():
+            assert found[name] == root.xpath(f'.//{path}', namespaces=NAMESPACES), name
+
+    def test_company_fields_match_by_path(self):
+        """Test that a contact person's cbc:Name is not read as the company name."""
+        company = etree.fromstring(
+            '<efac:Company'
+            ' xmlns:efac="http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1"'
+            ' xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"'
+            ' xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2">'
+            '<cac:PostalAddress><cbc:CityName>Wien</cbc:CityName>'
+            '<cac:Country><cbc:IdentificationCode>AUT</cbc:IdentificationCode></cac:Country></cac:PostalAddress>'
+            '<cac:Contact><cbc:Name>Jane Doe</cbc:Name><cbc:Telephone/></cac:Contact>'
+            '</efac:Company>'
+        )
+
+        assert _read_fields(company, COMPANY_FIELDS, {}) == {
+            'town': 'Wien', 'country_code': 'AUT', 'phone': None
+        }
+
     def test_get_format_name(self, parser):
         """Test parser format name."""
         assert parser.get_format_name() == "eForms UBL ContractAwardNotice"
@@ -10,6 +10,7 @@ based on the file format. These tests validate:
 
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 
 from tedawards.parsers.factory import ParserFactory
 from tedawards.parsers.ted_meta_xml import TedMetaXmlParser
@@ -105,6 +106,43 @@ class TestParserFactory:
         assert parser is not None, f"Factory should return a parser for {fixture_name}"
         assert isinstance(parser, EFormsUBLParser), f"Should detect eForms UBL parser for {fixture_name}"
 
+    @pytest.mark.parametrize("fixture_name", EFORMS_UBL_FIXTURES)
+    def test_factory_routes_by_root_element(self, factory, fixture_name):
+        """Test that a known root element is only checked by its own parser."""
+        with patch.object(TedV2Parser, 'can_parse') as ted_v2_can_parse:
+            parser = factory.get_parser(FIXTURES_DIR / fixture_name)
+
+        assert isinstance(parser, EFormsUBLParser)
+        ted_v2_can_parse.assert_not_called()
+
+    def test_factory_routes_past_doctype(self, factory):
+        """Test that the root element is found after a DOCTYPE with an internal subset."""
+        with patch.object(TedV2Parser, 'can_parse') as ted_v2_can_parse:
+            parser = factory.get_parser(FIXTURES_DIR / "ted_internal_ojs_r2_0_5_2008.en")
+
+        assert isinstance(parser, TedInternalOjsParser)
+        ted_v2_can_parse.assert_not_called()
+
+    def test_factory_rejects_non_award_notice(self, factory, tmp_path):
+        """Test that a notice rejected by the parser for its root gets no parser."""
+        notice = tmp_path / "contract_notice.xml"
+        notice.write_text(
+            '<?xml version="1.0"?>'
+            '<ContractNotice xmlns="urn:oasis:names:specification:ubl:schema:xsd:ContractNotice-2"/>'
+        )
+
+        assert factory.get_parser(notice) is None
+
+    def test_factory_detect_returns_root_read_by_check(self, factory):
+        """Test that detect passes on the tree a parser built while checking the file."""
+        parser, root = factory.detect(FIXTURES_DIR / "ted_v2_r2_0_9_2024.xml")
+        assert isinstance(parser, TedV2Parser)
+        assert root is not None and root.tag.endswith('TED_EXPORT')
+
+        parser, root = factory.detect(FIXTURES_DIR / "eforms_ubl_2025.xml")
+        assert isinstance(parser, EFormsUBLParser)
+        assert root is None
+
     def test_factory_supported_formats(self, factory):
         """Test factory returns list of supported formats."""
         formats = factory.get_supported_formats()
@@ -1,7 +1,9 @@
 """Tests for TED INTERNAL_OJS R2.0.5 parser."""
 
 import pytest
+from datetime import date
 from pathlib import Path
+from tedawards.parsers.base import parse_yyyymmdd
 from tedawards.parsers.ted_internal_ojs import TedInternalOjsParser
 
 
@@ -112,3 +114,13 @@ def test_parse_value_formatting(parser):
 
     # Test empty value
     assert parser._parse_value("") is None
+
+
+def test_parse_yyyymmdd():
+    """Test compact date parsing used for OJS and dispatch dates."""
+    assert parse_yyyymmdd("20080103") == date(2008, 1, 3)
+
+    # Invalid calendar dates and non-digit values are rejected
+    for value in ("20080230", "2008-1-3", "2008W011"):
+        with pytest.raises(ValueError):
+            parse_yyyymmdd(value)
@@ -9,8 +9,11 @@ These tests validate:
 4. Data validation using Pydantic models
 """
 
+import zipfile
+
 import pytest
 from pathlib import Path
+from lxml import etree
 
 from tedawards.parsers.ted_meta_xml import TedMetaXmlParser
 from tedawards.schema import (
@@ -85,6 +88,42 @@ class TestTedMetaXmlParser:
         """Test parser format name."""
         assert parser.get_format_name() == "TED META XML"
 
+    def test_contract_value_from_contents(self, parser):
+        """Test contract value lookup before and after the currency."""
+        def value(text):
+            doc = etree.fromstring(f"<CONTRACT_AWARD><contents><p>{text}</p></contents></CONTRACT_AWARD>")
+            return parser._parse_xml_contract_value(doc)
+
+        assert value("Total value: EUR 1,250,000") == 1250000.0
+        assert value("Total value: 98 500.50 eur excluding VAT") == 98500.5
+        assert value("Lot 1:   \n   12 000 \u20ac") == 12000.0
+        # Only the first amount before EUR is tried
+        assert value("Lot A . EUR; 2 000 EUR") is None
+        assert value("No amount given") is None
+
+    def test_parse_translation_before_english_original(self, parser, tmp_path):
+        """Test that an English notice after another language in the same <doc> is kept."""
+        def notice(lang):
+            return (
+                f'<CONTRACT_AWARD category="orig" lg="{lang}">'
+                '<refojs><datepub>20090102</datepub></refojs>'
+                '<codifdata><nodocojs>123-2009</nodocojs><isocountry>FR</isocountry></codifdata>'
+                '<tidoc><p>FR-Paris: services</p></tidoc>'
+                '</CONTRACT_AWARD>'
+            )
+
+        archive = tmp_path / "en_20090102_001_meta_org.zip"
+        with zipfile.ZipFile(archive, 'w') as zf:
+            zf.writestr(
+                "EN_20090102_001_META_ORG",
+                f'<part id="1" lg="en"><doc id="123-2009">{notice("fr")}{notice("en")}</doc></part>'
+            )
+
+        result = parser.parse_xml_file(archive)
+
+        assert result is not None
+        assert [award.document.doc_id for award in result.awards] == ['meta-123-2009-20090102']
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
@@ -277,6 +277,53 @@ class TestTedV2R209Parser:
         assert parser.get_format_name() == "TED 2.0"
 
 
+class TestTedV2Detection:
+    """Tests for TED 2.0 detection of non-award and foreign documents."""
+
+    @pytest.fixture
+    def parser(self):
+        """Create a TED V2 parser instance."""
+        return TedV2Parser()
+
+    def test_rejects_non_award_notice_before_form_section(self, parser, tmp_path):
+        """Test that non-award notices are rejected at the document type."""
+        xml = (FIXTURES_DIR / "ted_v2_r2_0_9_2024.xml").read_text(encoding="utf-8")
+        form_start = xml.index("<FORM_SECTION>")
+
+        # The form section is cut off, so this only passes if parsing stops early
+        non_award = tmp_path / "non_award.xml"
+        non_award.write_text(xml[:form_start].replace('TD_DOCUMENT_TYPE CODE="7"', 'TD_DOCUMENT_TYPE CODE="3"'), encoding="utf-8")
+
+        assert parser.can_parse(non_award) is False
+
+    def test_rejects_other_root_element(self, parser, tmp_path):
+        """Test that award-like elements under another root are rejected."""
+        other = tmp_path / "other.xml"
+        other.write_text('<?xml version="1.0"?><NOTICE><TD_DOCUMENT_TYPE CODE="7"/><F03_2014/></NOTICE>')
+
+        assert parser.can_parse(other) is False
+
+    def test_can_parse_does_not_keep_tree(self, parser):
+        """Test that can_parse only checks the file and accept returns the tree."""
+        fixture_file = FIXTURES_DIR / "ted_v2_r2_0_9_2024.xml"
+
+        assert parser.can_parse(fixture_file) is True
+        assert not vars(parser)
+        assert parser.accept(fixture_file)[1] is not None
+
+    def test_parse_root_uses_root_from_detection(self, parser):
+        """Test that parse_root extracts from the given root rather than the file."""
+        fixture_file = FIXTURES_DIR / "ted_v2_r2_0_9_2024.xml"
+        accepted, root = parser.accept(fixture_file)
+        assert accepted is True
+
+        root.set('DOC_ID', 'from-detection')
+        result = parser.parse_root(root, fixture_file)
+
+        assert result is not None
+        assert result.awards[0].document.doc_id == 'from-detection'
+
+
 class TestDataValidation:
     """Tests for data validation and quality."""
 
@@ -0,0 +1,35 @@
+"""
+Tests for hashing.py entity hashes.
+
+Stored entity_hash values are matched on every import, so these tests pin the
+exact hash strings: any change to the algorithm or normalization must fail here.
+"""
+
+from tedawards.hashing import generate_entity_hash
+from tedawards.schema import ContractingBodyModel, ContractorModel
+
+
+class TestEntityHash:
+    """Tests for entity hash values."""
+
+    def test_contractor_hash_is_stable(self):
+        """Test that the contractor hash matches the value stored by earlier imports."""
+        contractor = ContractorModel(official_name="ACME GMBH", country_code="DE")
+        assert contractor.entity_hash == "0bb1b6ebb709be5e"
+
+    def test_contracting_body_hash_is_stable(self):
+        """Test that the contracting body hash matches the value stored by earlier imports."""
+        body = ContractingBodyModel(official_name="Stadt Berlin", country_code="DE", town="Berlin")
+        assert body.entity_hash == generate_entity_hash(body, ['official_name', 'country_code', 'town'])
+        assert ContractingBodyModel(official_name="Stadt Berlin", country_code="DE").entity_hash == "c839a0ef5eac65d6"
+
+    def test_strings_normalized(self):
+        """Test that case and surrounding whitespace do not change the hash."""
+        contractor = ContractorModel(official_name=" Acme GmbH ", country_code="de")
+        assert contractor.entity_hash == "0bb1b6ebb709be5e"
+
+    def test_missing_and_empty_values_skipped(self):
+        """Test that None and empty strings hash the same as an absent field."""
+        with_empty = ContractingBodyModel(official_name="Stadt Berlin", country_code="DE", town="")
+        with_none = ContractingBodyModel(official_name="Stadt Berlin", country_code="DE", town=None)
+        assert with_empty.entity_hash == with_none.entity_hash == "c839a0ef5eac65d6"
@@ -2,24 +2,33 @@
 Tests for scraper.py logic.
 """
 
+import os
+import uuid
+
 import pytest
 import tempfile
 import tarfile
 from datetime import date, datetime
 from pathlib import Path
+from contextlib import contextmanager
 from unittest.mock import Mock, patch, MagicMock
 from decimal import Decimal
 
-from sqlalchemy import create_engine, select
+from sqlalchemy import create_engine, event, func, select
 from sqlalchemy.orm import sessionmaker
 
 from tedawards.scraper import (
     download_and_extract,
     process_file,
     save_awards,
+    save_awards_stream,
+    documents_exist,
     get_session,
     get_last_downloaded_issue,
-    get_package_number
+    get_package_number,
+    get_parse_pool,
+    iter_package_awards,
+    _set_sqlite_pragmas
 )
 from tedawards.models import (
     Base, TEDDocument, ContractingBody, Contract, Award, Contractor
@@ -42,7 +51,7 @@ def test_db():
     """Create a temporary in-memory database for testing."""
     engine = create_engine("sqlite:///:memory:", echo=False)
     Base.metadata.create_all(engine)
-    SessionLocal = sessionmaker(bind=engine, expire_on_commit=False)
+    SessionLocal = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
 
     # Patch the module-level engine and SessionLocal
     with patch('tedawards.scraper.engine', engine), \
@@ -50,6 +59,49 @@ def test_db():
         yield engine
 
 
+@pytest.fixture
+def pg_db():
+    """Create the tables in a throwaway schema of the PostgreSQL database set by DB_*."""
+    from tedawards.scraper import get_pg_engine
+
+    engine = get_pg_engine()
+    schema = f"tedawards_test_{uuid.uuid4().hex[:12]}"
+
+    @event.listens_for(engine, "connect")
+    def use_test_schema(dbapi_connection, connection_record):
+        with dbapi_connection.cursor() as cursor:
+            cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {schema}")
+            cursor.execute(f"SET search_path TO {schema}")
+        dbapi_connection.commit()
+
+    Base.metadata.create_all(engine)
+    try:
+        yield engine
+    finally:
+        with engine.begin() as connection:
+            connection.exec_driver_sql(f"DROP SCHEMA {schema} CASCADE")
+        engine.dispose()
+
+
+@contextmanager
+def count_queries(bind):
+    """Collect the SQL statements executed on bind (an engine or connection) in the block.
+
+    Yields the list of statements, so tests can assert an upper bound on the number of
+    queries and catch lazy-loading or per-row statement regressions.
+    """
+    statements = []
+
+    def listener(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(bind, "before_cursor_execute", listener)
+    try:
+        yield statements
+    finally:
+        event.remove(bind, "before_cursor_execute", listener)
+
+
 @pytest.fixture
 def sample_award_data():
     """Create sample award data for testing."""
@@ -210,7 +262,7 @@ class TestProcessFile:
         mock_parser.get_format_name.return_value = "Test Parser"
 
         # Mock parser factory
-        with patch('tedawards.scraper.parser_factory.get_parser', return_value=mock_parser):
+        with patch('tedawards.scraper.parser_factory.detect', return_value=(mock_parser, None)):
             result = process_file(xml_file)
 
             assert result is not None
@@ -218,12 +270,29 @@ class TestProcessFile:
             assert result.awards[0].document.doc_id == "12345-2024"
             mock_parser.parse_xml_file.assert_called_once_with(xml_file)
 
+    def test_process_file_parses_root_from_detection(self, temp_data_dir, sample_award_data):
+        """Test that a root read during detection is extracted without parsing again."""
+        xml_file = temp_data_dir / "test.xml"
+        xml_file.write_text("<test/>")
+        root = object()
+
+        mock_parser = Mock()
+        mock_parser.parse_root.return_value = TedParserResultModel(awards=[sample_award_data])
+        mock_parser.get_format_name.return_value = "Test Parser"
+
+        with patch('tedawards.scraper.parser_factory.detect', return_value=(mock_parser, root)):
+            result = process_file(xml_file)
+
+        assert len(result.awards) == 1
+        mock_parser.parse_root.assert_called_once_with(root, xml_file)
+        mock_parser.parse_xml_file.assert_not_called()
+
     def test_process_file_no_parser_available(self, temp_data_dir):
         """Test processing file when no parser is available."""
         xml_file = temp_data_dir / "test.xml"
         xml_file.write_text("<test/>")
 
-        with patch('tedawards.scraper.parser_factory.get_parser', return_value=None):
+        with patch('tedawards.scraper.parser_factory.detect', return_value=(None, None)):
             result = process_file(xml_file)
             assert result is None
 
@@ -236,7 +305,7 @@ class TestProcessFile:
         mock_parser.parse_xml_file.return_value = None
         mock_parser.get_format_name.return_value = "Test Parser"
 
-        with patch('tedawards.scraper.parser_factory.get_parser', return_value=mock_parser):
+        with patch('tedawards.scraper.parser_factory.detect', return_value=(mock_parser, None)):
             result = process_file(xml_file)
             assert result is None
 
@@ -248,7 +317,7 @@ class TestProcessFile:
         mock_parser = Mock()
         mock_parser.parse_xml_file.side_effect = ValueError("Invalid XML")
 
-        with patch('tedawards.scraper.parser_factory.get_parser', return_value=mock_parser):
+        with patch('tedawards.scraper.parser_factory.detect', return_value=(mock_parser, None)):
             with pytest.raises(ValueError, match="Invalid XML"):
                 process_file(xml_file)
 
@@ -407,6 +476,82 @@ class TestSaveAwards:
         finally:
             session.close()
 
+    def test_save_existing_contractor_reused_across_batches(self, test_db, sample_award_data):
+        """Test that a contractor saved by an earlier batch is linked, not re-inserted."""
+        from tedawards.scraper import SessionLocal
+
+        later_award_data = sample_award_data.model_copy(update={
+            'document': DocumentModel(
+                doc_id="67890-2024",
+                publication_date=date(2024, 2, 1)
+            )
+        })
+
+        session = SessionLocal()
+        try:
+            save_awards(session, [sample_award_data])
+            session.commit()
+            save_awards(session, [later_award_data])
+            session.commit()
+
+            contractor = session.execute(select(Contractor)).scalar_one()
+            assert len(contractor.awards) == 2
+
+        finally:
+            session.close()
+
+    def test_contractor_inserted_after_lookup_resolves_to_existing_row(self, test_db, sample_award_data):
+        """Test that a contractor missed by the lookup still resolves through ON CONFLICT."""
+        from sqlalchemy import bindparam, false
+        from tedawards.scraper import SessionLocal, _bulk_statements
+
+        later_award_data = sample_award_data.model_copy(update={
+            'document': DocumentModel(doc_id="67890-2024")
+        })
+
+        # Simulate a writer inserting the contractor between lookup and insert
+        stmts = dict(_bulk_statements('sqlite'))
+        stmts['select_contractors'] = (
+            select(Contractor.entity_hash, Contractor.id)
+            .where(Contractor.entity_hash.in_(bindparam('hashes', expanding=True)))
+            .where(false())
+        )
+
+        session = SessionLocal()
+        try:
+            save_awards(session, [sample_award_data])
+            session.commit()
+            with patch('tedawards.scraper._bulk_statements', return_value=stmts):
+                save_awards(session, [later_award_data])
+            session.commit()
+
+            contractor = session.execute(select(Contractor)).scalar_one()
+            assert len(contractor.awards) == 2
+
+        finally:
+            session.close()
+
+    def test_save_repeated_contractor_linked_once(self, test_db, sample_award_data):
+        """Test that a contractor listed twice on one award yields a single link row."""
+        from tedawards.scraper import SessionLocal
+        from tedawards.models import award_contractors
+
+        award = sample_award_data.awards[0]
+        award_data = sample_award_data.model_copy(update={
+            'awards': [award.model_copy(update={'contractors': award.contractors * 2})]
+        })
+
+        session = SessionLocal()
+        try:
+            save_awards(session, [award_data])
+            session.commit()
+
+            links = session.execute(select(award_contractors)).all()
+            assert len(links) == 1
+
+        finally:
+            session.close()
+
     def test_save_multiple_awards_same_contract(self, test_db):
         """Test saving multiple awards for same contract."""
         from tedawards.scraper import SessionLocal
@@ -469,6 +614,46 @@ class TestSaveAwards:
         finally:
             session.close()
 
+    def test_save_awards_without_title_or_date_kept_separate(self, test_db):
+        """Test that awards with NULL key parts are not collapsed into one row."""
+        from tedawards.scraper import SessionLocal
+
+        award_data = TedAwardDataModel(
+            document=DocumentModel(
+                doc_id="12345-2008",
+                publication_date=date(2008, 1, 1)
+            ),
+            contracting_body=ContractingBodyModel(
+                official_name="Test Body"
+            ),
+            contract=ContractModel(
+                title="Multi-lot Contract"
+            ),
+            awards=[
+                AwardModel(
+                    contract_number="1",
+                    contractors=[ContractorModel(official_name="Contractor A")]
+                ),
+                AwardModel(
+                    contract_number="2",
+                    contractors=[ContractorModel(official_name="Contractor B")]
+                )
+            ]
+        )
+
+        session = SessionLocal()
+        try:
+            save_awards(session, [award_data])
+            session.commit()
+
+            awards = session.execute(select(Award).order_by(Award.contract_number)).scalars().all()
+            assert [a.contract_number for a in awards] == ["1", "2"]
+            assert [c.official_name for c in awards[0].contractors] == ["Contractor A"]
+            assert [c.official_name for c in awards[1].contractors] == ["Contractor B"]
+
+        finally:
+            session.close()
+
     def test_save_complete_reimport_is_idempotent(self, test_db, sample_award_data):
         """Test that re-importing the same data is completely idempotent."""
         from tedawards.scraper import SessionLocal
@@ -514,6 +699,30 @@ class TestSaveAwards:
         finally:
             session.close()
 
+    def test_reimport_skips_stored_documents(self, test_db):
+        """Test that re-saving a stored document does not duplicate its NULL-keyed awards."""
+        from tedawards.scraper import SessionLocal
+
+        award_data = TedAwardDataModel(
+            document=DocumentModel(doc_id="12345-2008"),
+            contracting_body=ContractingBodyModel(official_name="Test Body"),
+            contract=ContractModel(title="Test Contract"),
+            awards=[AwardModel(contract_number="1")]
+        )
+
+        session = SessionLocal()
+        try:
+            assert save_awards(session, [award_data]) == 1
+            session.commit()
+            assert save_awards(session, [award_data]) == 1
+            session.commit()
+
+            awards = session.execute(select(Award)).all()
+            assert len(awards) == 1
+
+        finally:
+            session.close()
+
     def test_contracting_body_shared_across_documents(self, test_db):
         """Test that same contracting body is shared across multiple documents."""
         from tedawards.scraper import SessionLocal
@@ -580,6 +789,80 @@ class TestSaveAwards:
         finally:
             session.close()
 
+    def test_entity_ids_reused_between_batches(self, test_db, sample_award_data):
+        """Test that resolved contracting body and contractor ids are collected and reused."""
+        from tedawards.scraper import SessionLocal
+
+        second = sample_award_data.model_copy(
+            update={'document': DocumentModel(doc_id="67890-2024")}
+        )
+
+        session = SessionLocal()
+        try:
+            body_ids = {}
+            contractor_ids = {}
+            save_awards(session, [sample_award_data], body_ids, contractor_ids)
+            assert list(body_ids) == [sample_award_data.contracting_body.entity_hash]
+            assert list(contractor_ids) == [sample_award_data.awards[0].contractors[0].entity_hash]
+
+            with patch.object(session, 'execute', wraps=session.execute) as execute:
+                save_awards(session, [second], body_ids, contractor_ids)
+            executed = [str(call.args[0]) for call in execute.call_args_list]
+            assert not any('FROM contracting_bodies' in stmt for stmt in executed)
+            assert not any('FROM contractors' in stmt for stmt in executed)
+
+            session.commit()
+            assert len(session.execute(select(ContractingBody)).all()) == 1
+            assert len(session.execute(select(TEDDocument)).all()) == 2
+            assert len(session.execute(select(Contractor)).all()) == 1
+
+        finally:
+            session.close()
+
+    def test_save_awards_tracks_no_orm_objects(self, test_db, sample_award_data):
+        """Test that links are written as rows without loading ORM objects into the session."""
+        from tedawards.scraper import SessionLocal
+
+        session = SessionLocal()
+        try:
+            save_awards(session, [sample_award_data])
+            assert len(session.identity_map) == 0
+            assert not session.new
+
+        finally:
+            session.close()
+
+    def test_statement_count_independent_of_batch_size(self, test_db):
+        """Test that each table is written with multi-row statements, not one per row."""
+        from tedawards.scraper import SessionLocal
+
+        def notices(count, offset):
+            return [
+                TedAwardDataModel(
+                    document=DocumentModel(doc_id=f"{offset + i}-2024"),
+                    contracting_body=ContractingBodyModel(official_name=f"Body {offset + i}"),
+                    contract=ContractModel(title="Contract"),
+                    awards=[AwardModel(
+                        award_title="Lot 1",
+                        conclusion_date=date(2024, 1, 1),
+                        contractors=[ContractorModel(official_name=f"Contractor {offset + i}")]
+                    )]
+                )
+                for i in range(count)
+            ]
+
+        def count_statements(awards):
+            session = SessionLocal()
+            try:
+                with count_queries(test_db) as statements:
+                    save_awards(session, awards)
+                    session.commit()
+            finally:
+                session.close()
+            return len(statements)
+
+        assert count_statements(notices(1, 0)) == count_statements(notices(50, 100))
+
     def test_save_award_validation_error_propagates(self, test_db):
         """Test that validation errors are propagated."""
         from tedawards.scraper import SessionLocal
@@ -612,6 +895,362 @@ class TestSaveAwards:
             session.close()
 
 
+class TestRowValues:
+    """Tests for reading stored fields from models."""
+
+    def test_row_values_match_model_dump(self, sample_award_data):
+        """Test that rows read from __dict__ equal pydantic's own dump of the same fields."""
+        from tedawards.scraper import (
+            _row_values, DOCUMENT_FIELDS, CONTRACTING_BODY_FIELDS, CONTRACT_FIELDS,
+            AWARD_FIELDS, CONTRACTOR_FIELDS
+        )
+
+        award = sample_award_data.awards[0]
+        for model, fields in [
+            (sample_award_data.document, DOCUMENT_FIELDS),
+            (sample_award_data.contracting_body, CONTRACTING_BODY_FIELDS),
+            (sample_award_data.contract, CONTRACT_FIELDS),
+            (award, AWARD_FIELDS),
+            (award.contractors[0], CONTRACTOR_FIELDS),
+        ]:
+            assert _row_values(model, fields) == model.model_dump(include=set(fields))
+
+    def test_row_tuple_in_field_order(self, sample_award_data):
+        """Test that row tuples hold the same values as row dicts, in field order."""
+        from tedawards.scraper import _row_tuple, _row_values, DOCUMENT_FIELDS
+
+        document = sample_award_data.document
+        assert _row_tuple(document, DOCUMENT_FIELDS) == tuple(_row_values(document, DOCUMENT_FIELDS).values())
+
+
+class TestIterPackageAwards:
+    """Tests for iter_package_awards function."""
+
+    def test_parse_pool_matches_sequential_parsing(self):
+        """Test that parsing on worker processes yields the same awards in file order."""
+        fixtures_dir = Path(__file__).parent / "fixtures"
+        files = sorted(fixtures_dir.glob("*.xml")) + sorted(fixtures_dir.glob("*.en"))
+
+        sequential = list(iter_package_awards(files))
+        with get_parse_pool(2) as parse_pool:
+            parallel = list(iter_package_awards(files, parse_pool))
+
+        assert sequential
+        assert parallel == sequential
+
+    def test_single_worker_parses_in_process(self):
+        """Test that one parse worker does not start a process pool."""
+        with get_parse_pool(1) as parse_pool:
+            assert parse_pool is None
+
+
+class TestSaveAwardsStream:
+    """Tests for save_awards_stream function."""
+
+    def test_chunks_share_entities_and_skip_repeats(self, test_db):
+        """Test that chunked saving matches a single batch across chunk boundaries."""
+        from tedawards.scraper import SessionLocal
+
+        def notice(doc_id):
+            return TedAwardDataModel(
+                document=DocumentModel(doc_id=doc_id),
+                contracting_body=ContractingBodyModel(official_name="Shared Body", country_code="DE"),
+                contract=ContractModel(title="Contract"),
+                awards=[AwardModel(
+                    award_title="Lot 1",
+                    conclusion_date=date(2024, 1, 1),
+                    contractors=[ContractorModel(official_name="Shared Contractor", country_code="DE")]
+                )]
+            )
+
+        notices = (notice(doc_id) for doc_id in ["1-2024", "2-2024", "1-2024"])
+
+        session = SessionLocal()
+        try:
+            assert save_awards_stream(session, notices, chunk_size=1) == 3
+            session.commit()
+
+            assert len(session.execute(select(TEDDocument)).all()) == 2
+            assert len(session.execute(select(ContractingBody)).all()) == 1
+            assert len(session.execute(select(Award)).all()) == 2
+            assert len(session.execute(select(Contractor)).all()) == 1
+
+        finally:
+            session.close()
+
+
+class TestRelationshipLoading:
+    """Tests for relationship loading strategies."""
+
+    def test_document_tree_loads_without_n_plus_one(self, test_db):
+        """Test that traversing documents down to contractors issues one query per level."""
+        from tedawards.scraper import SessionLocal
+
+        notices = [
+            TedAwardDataModel(
+                document=DocumentModel(doc_id=f"{i}-2024"),
+                contracting_body=ContractingBodyModel(official_name="Body"),
+                contract=ContractModel(title="Contract"),
+                awards=[AwardModel(
+                    award_title=f"Lot {lot}",
+                    conclusion_date=date(2024, 1, 1),
+                    contractors=[ContractorModel(official_name=f"Contractor {i}-{lot}")]
+                ) for lot in range(3)]
+            )
+            for i in range(5)
+        ]
+
+        session = SessionLocal()
+        try:
+            save_awards(session, notices)
+            session.commit()
+
+            with count_queries(test_db) as statements:
+                documents = session.execute(select(TEDDocument)).scalars().all()
+                contractor_names = {
+                    contractor.official_name
+                    for document in documents
+                    for contract in document.contracts
+                    for award in contract.awards
+                    for contractor in award.contractors
+                }
+
+            assert len(contractor_names) == 15
+            # documents, contracts, awards, contractors
+            assert len(statements) == 4
+
+        finally:
+            session.close()
+
+
+class TestAwardDenormView:
+    """Tests for the v_award_denorm view."""
+
+    def test_view_joins_award_contract_and_body(self, test_db, sample_award_data):
+        """Test that saved awards appear in the view with contract and body columns."""
+        from tedawards.scraper import SessionLocal
+        from tedawards.models import AwardDenorm
+
+        session = SessionLocal()
+        try:
+            save_awards(session, [sample_award_data])
+            session.commit()
+
+            row = session.execute(select(AwardDenorm)).scalar_one()
+            assert row.ted_doc_id == sample_award_data.document.doc_id
+            assert row.main_cpv_code == sample_award_data.contract.main_cpv_code
+            assert row.country_code == sample_award_data.contracting_body.country_code
+            assert row.award_title == sample_award_data.awards[0].award_title
+
+        finally:
+            session.close()
+
+
+class TestDocumentsExist:
+    """Tests for documents_exist function."""
+
+    def test_returns_only_stored_doc_ids(self, test_db, sample_award_data):
+        """Test that only stored document ids are returned."""
+        from tedawards.scraper import SessionLocal
+
+        session = SessionLocal()
+        try:
+            save_awards(session, [sample_award_data])
+            session.commit()
+
+            assert documents_exist(session, ["12345-2024", "missing-2024"]) == {"12345-2024"}
+            assert documents_exist(session, []) == set()
+
+        finally:
+            session.close()
+
+    def test_postgresql_lookup_binds_one_array(self):
+        """Test that the PostgreSQL lookup compiles to = ANY over a single parameter."""
+        from sqlalchemy.dialects import postgresql
+        from tedawards.scraper import _bulk_statements
+
+        stmt = _bulk_statements('postgresql')['select_documents']
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        assert '= ANY (%(doc_ids)s::VARCHAR[])' in str(compiled)
+
+
+class TestCopyInsert:
+    """Tests for the _copy_insert bulk insert paths."""
+
+    def test_dialect_follows_session_bind(self, test_db, sample_award_data):
+        """Test that the insert path is chosen by the session's bind, not the module engine."""
+        from sqlalchemy.dialects import postgresql
+
+        session = sessionmaker(bind=test_db)()
+        try:
+            with patch('tedawards.scraper.engine', Mock(dialect=postgresql.dialect())):
+                assert save_awards(session, [sample_award_data]) == 1
+            session.commit()
+
+            assert session.query(TEDDocument).count() == 1
+        finally:
+            session.close()
+
+    @pytest.mark.postgresql
+    @pytest.mark.skipif(not os.getenv('DB_HOST'), reason="needs a PostgreSQL server (DB_HOST)")
+    def test_postgresql_save_same_awards_twice(self, pg_db, sample_award_data):
+        """Test that the COPY staging path stores each row once across repeated saves."""
+        from tedawards.models import award_contractors, document_contracting_bodies
+
+        second = sample_award_data.model_copy(update={
+            'document': sample_award_data.document.model_copy(update={'doc_id': "67890-2024"})
+        })
+        counted = (TEDDocument, ContractingBody, Contract, Award, Contractor)
+
+        def row_counts(session):
+            counts = [session.query(model).count() for model in counted]
+            counts += [session.execute(select(func.count()).select_from(table)).scalar()
+                       for table in (document_contracting_bodies, award_contractors)]
+            return counts
+
+        session = sessionmaker(bind=pg_db)()
+        try:
+            assert save_awards(session, [sample_award_data, second]) == 2
+            session.commit()
+            first_counts = row_counts(session)
+            assert first_counts == [2, 1, 2, 2, 1, 2, 2]
+
+            assert save_awards(session, [sample_award_data, second]) == 2
+            session.commit()
+            assert row_counts(session) == first_counts
+        finally:
+            session.close()
+
+    @pytest.mark.postgresql
+    @pytest.mark.skipif(not os.getenv('DB_HOST'), reason="needs a PostgreSQL server (DB_HOST)")
+    def test_postgresql_copy_skips_existing_rows(self, pg_db, sample_award_data):
+        """Test that staged rows conflicting with stored ones are skipped within a transaction."""
+        from tedawards.scraper import _bulk_statements, _copy_insert, _row_tuple, DOCUMENT_FIELDS
+
+        stmt = _bulk_statements('postgresql')['insert_documents']
+        first = _row_tuple(sample_award_data.document, DOCUMENT_FIELDS)
+        second = _row_tuple(
+            sample_award_data.document.model_copy(update={'doc_id': "67890-2024"}), DOCUMENT_FIELDS
+        )
+
+        session = sessionmaker(bind=pg_db)()
+        try:
+            # The second call reuses the staging table emptied by the first
+            _copy_insert(session, stmt, DOCUMENT_FIELDS, [first])
+            _copy_insert(session, stmt, DOCUMENT_FIELDS, [first, second])
+            session.commit()
+
+            assert sorted(session.scalars(select(TEDDocument.doc_id))) == ["12345-2024", "67890-2024"]
+        finally:
+            session.close()
+
+
+class TestLookupIndexes:
+    """Tests that dedup lookups are served by indexes."""
+
+    def test_contractor_lookups_use_index(self, test_db):
+        """Test that contractor lookups search an index instead of scanning the table."""
+        from sqlalchemy import text
+
+        with test_db.connect() as conn:
+            hash_plan = conn.execute(text(
+                "EXPLAIN QUERY PLAN SELECT id FROM contractors WHERE entity_hash IN ('a', 'b')"
+            )).all()
+            name_plan = conn.execute(text(
+                "EXPLAIN QUERY PLAN SELECT id FROM contractors "
+                "WHERE official_name = 'a' AND country_code = 'DE'"
+            )).all()
+
+        assert hash_plan[0][-1].startswith('SEARCH')
+        assert 'ix_contractors_entity_hash' in hash_plan[0][-1]
+        assert name_plan[0][-1].startswith('SEARCH')
+        assert 'idx_contractors_country_name' in name_plan[0][-1]
+
+    def test_no_index_is_prefix_of_another(self):
+        """Test that no full index duplicates the leading columns of another index."""
+        from sqlalchemy import UniqueConstraint
+
+        for table in Base.metadata.sorted_tables:
+            keys = [
+                (index.name, tuple(getattr(expression, 'name', str(expression)) for expression in index.expressions))
+                for index in table.indexes
+                # Partial indexes hold a subset of rows, so a prefix is not redundant
+                if index.dialect_options['sqlite']['where'] is None
+            ]
+            keys += [
+                (constraint.name, tuple(column.name for column in constraint.columns))
+                for constraint in table.constraints
+                if isinstance(constraint, UniqueConstraint)
+            ]
+            for name, columns in keys:
+                for other_name, other_columns in keys:
+                    if name != other_name and len(columns) < len(other_columns):
+                        assert other_columns[:len(columns)] != columns, (
+                            f"{table.name}: {name} is a prefix of {other_name}"
+                        )
+
+    def test_natural_key_tables_without_rowid(self, test_db):
+        """Test that documents and association tables are clustered by their primary key."""
+        from sqlalchemy import text
+
+        with test_db.connect() as conn:
+            table_sql = dict(conn.execute(text(
+                "SELECT name, sql FROM sqlite_master WHERE type = 'table'"
+            )).all())
+
+        for name in ['ted_documents', 'award_contractors', 'document_contracting_bodies']:
+            assert table_sql[name].rstrip().endswith('WITHOUT ROWID')
+        assert not table_sql['contractors'].rstrip().endswith('WITHOUT ROWID')
+
+    def test_case_insensitive_name_lookups_use_index(self, test_db):
+        """Test that lower(official_name) lookups search the expression indexes."""
+        from sqlalchemy import text
+
+        with test_db.connect() as conn:
+            contractor_plan = conn.execute(text(
+                "EXPLAIN QUERY PLAN SELECT id FROM contractors WHERE lower(official_name) = 'acme gmbh'"
+            )).all()
+            body_plan = conn.execute(text(
+                "EXPLAIN QUERY PLAN SELECT id FROM contracting_bodies WHERE lower(official_name) = 'stadt berlin'"
+            )).all()
+
+        assert 'idx_contractors_name_lower' in contractor_plan[0][-1]
+        assert 'idx_contracting_body_name_lower' in body_plan[0][-1]
+
+    def test_sme_filter_uses_partial_index(self, test_db):
+        """Test that SME filters by country search the partial index of SME rows."""
+        from sqlalchemy import text
+
+        with test_db.connect() as conn:
+            plan = conn.execute(text(
+                "EXPLAIN QUERY PLAN SELECT country_code, count(*) FROM contractors "
+                "WHERE is_sme = 1 AND country_code = 'DE'"
+            )).all()
+            index_sql = conn.execute(text(
+                "SELECT sql FROM sqlite_master WHERE name = 'idx_contractors_sme_country'"
+            )).scalar_one()
+
+        assert 'idx_contractors_sme_country' in plan[0][-1]
+        assert index_sql.endswith('WHERE is_sme = 1')
+
+    def test_award_join_ranges_use_composite_indexes(self, test_db):
+        """Test that per-contract date and value filters search the composite indexes."""
+        from sqlalchemy import text
+
+        with test_db.connect() as conn:
+            date_plan = conn.execute(text(
+                "EXPLAIN QUERY PLAN SELECT id FROM awards "
+                "WHERE contract_id = 1 AND conclusion_date >= '2024-01-01'"
+            )).all()
+            value_plan = conn.execute(text(
+                "EXPLAIN QUERY PLAN SELECT awarded_value FROM awards "
+                "WHERE contract_id = 1 AND awarded_value > 1000"
+            )).all()
+
+        assert 'idx_award_contract_date' in date_plan[0][-1]
+        assert 'idx_award_contract_value' in value_plan[0][-1]
+
+
 class TestGetSession:
     """Tests for get_session context manager."""
 
@@ -664,6 +1303,25 @@ class TestGetSession:
             verify_session.close()
 
 
+class TestSqlitePragmas:
+    """Tests for SQLite connection tuning."""
+
+    def test_pragmas_applied_on_connect(self, temp_data_dir):
+        """Test that WAL journaling and tuned PRAGMAs are set on new connections."""
+        from sqlalchemy import event, text
+
+        engine = create_engine(f"sqlite:///{temp_data_dir / 'pragmas.db'}")
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+        try:
+            with engine.connect() as conn:
+                assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+                assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+                assert conn.execute(text("PRAGMA foreign_keys")).scalar() == 1
+                assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+        finally:
+            engine.dispose()
+
+
 class TestGetPackageNumber:
     """Tests for get_package_number function."""
 
@@ -907,3 +1565,102 @@ class TestScrapeYearResumeBehavior:
 
         # Should start from issue 1 when no existing data
         assert requested_issues[0] == 1
+
+
+class TestScrapeYearScheduling:
+    """Tests for scrape_year download scheduling and setup."""
+
+    def test_parallel_downloads_stop_after_consecutive_404s(self, test_db, temp_data_dir):
+        """Test that downloads ahead of processing do not run past the 404 cutoff window."""
+        from tedawards.scraper import scrape_year
+
+        requested_issues = []
+
+        def mock_download(package_num, data_dir):
+            requested_issues.append(package_num % 100000)
+            return None
+
+        with patch('tedawards.scraper.download_and_extract', side_effect=mock_download):
+            scrape_year(2024, start_issue=1, max_issue=50, data_dir=temp_data_dir, workers=3)
+
+        # Issues 1-10 are processed; at most the queued downloads behind them are requested
+        assert sorted(requested_issues)[:10] == list(range(1, 11))
+        assert max(requested_issues) <= 13
+
+    def test_failed_save_discards_downloads_ahead(self, test_db, temp_data_dir):
+        """Test that packages downloaded ahead of a failed save are fetched again on resume."""
+        from tedawards.scraper import scrape_year
+
+        def mock_download(package_num, data_dir):
+            package_dir = data_dir / f"{package_num:09d}"
+            package_dir.mkdir(exist_ok=True)
+            notice = package_dir / "notice.xml"
+            notice.write_text("<notice/>")
+            return [notice]
+
+        def package_awards(files, parse_pool=None):
+            if files[0].parent.name.endswith('2'):
+                raise RuntimeError("save failed")
+            return iter([])
+
+        # A package downloaded by an earlier run is left in place
+        (temp_data_dir / "202400004").mkdir()
+
+        with patch('tedawards.scraper.download_and_extract', side_effect=mock_download), \
+             patch('tedawards.scraper.iter_package_awards', side_effect=package_awards):
+            with pytest.raises(RuntimeError, match="save failed"):
+                scrape_year(2024, start_issue=1, max_issue=5, data_dir=temp_data_dir, workers=3)
+
+        remaining = sorted(path.name for path in temp_data_dir.iterdir())
+        assert remaining == ["202400001", "202400004"]
+
+    def test_entity_ids_reused_between_packages(self, test_db, temp_data_dir):
+        """Test that entities committed by one package are not looked up again by the next."""
+        from tedawards.scraper import scrape_year
+
+        # Index of the first statement of each package; statements before the first
+        # download (the schema check) are not counted
+        package_starts = []
+
+        def package_awards(files, parse_pool=None):
+            issue = files[0]
+            package_starts.append(len(statements))
+            return iter([TedAwardDataModel(
+                document=DocumentModel(doc_id=f"{issue}-2024"),
+                contracting_body=ContractingBodyModel(official_name="Body"),
+                contract=ContractModel(title="Contract"),
+                awards=[AwardModel(contractors=[ContractorModel(official_name="Contractor")])]
+            )])
+
+        def mock_download(package_num, data_dir):
+            issue = package_num % 100000
+            return [issue] if issue <= 2 else None
+
+        with count_queries(test_db) as statements, \
+             patch('tedawards.scraper.download_and_extract', side_effect=mock_download), \
+             patch('tedawards.scraper.iter_package_awards', side_effect=package_awards):
+            scrape_year(2024, start_issue=1, max_issue=12, data_dir=temp_data_dir)
+
+        first_start, second_start = package_starts
+        first = statements[first_start:second_start]
+        second = statements[second_start:]
+        assert any('FROM contractors' in statement for statement in first)
+        assert not any('FROM contracting_bodies' in statement for statement in second)
+        assert not any('FROM contractors' in statement for statement in second)
+
+        session = sessionmaker(bind=test_db)()
+        try:
+            assert session.query(Contractor).count() == 1
+            assert session.query(Award).count() == 2
+        finally:
+            session.close()
+
+    def test_schema_checked_once_per_engine(self, test_db, temp_data_dir):
+        """Test that scraping several years inspects the schema only once."""
+        from tedawards.scraper import scrape_year_range
+
+        with patch('tedawards.scraper.download_and_extract', return_value=None), \
+             patch.object(Base.metadata, 'create_all') as create_all:
+            scrape_year_range(2022, 2024, data_dir=temp_data_dir)
+
+        create_all.assert_called_once_with(test_db)